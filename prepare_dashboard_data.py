@@ -9,6 +9,75 @@ import pandas as pd
 import os
 from pathlib import Path
 
+from src.database_manager import CSV_SCHEMA, FAST_IO
+
+
+# Column dtypes for the processed dataset (declared up front to skip type inference)
+SCHEMA = {
+    **CSV_SCHEMA,
+    'job_title_clean': 'string',
+    'skills': 'string'
+}
+
+
+PROCESSED_DIR = 'data/processed'
+
+# Skill counts per filter combination, read by the dashboard instead of the raw rows
+SKILLS_INDEX_FILE = 'skills_index.parquet'
+SKILLS_INDEX_KEYS = ['location', 'job_title_clean', 'experience_level']
+
+
+def scan_processed_dir():
+    """Return {file name: stat result} for the processed data directory"""
+    try:
+        with os.scandir(PROCESSED_DIR) as it:
+            return {entry.name: entry.stat() for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return {}
+
+
+def read_processed_csv(path):
+    """Read a processed CSV with SCHEMA, using the pyarrow engine when available"""
+    try:
+        return pd.read_csv(path, dtype=SCHEMA, engine='pyarrow')
+    except ImportError:
+        return pd.read_csv(path, dtype=SCHEMA, engine='c')
+
+
+def _count_skills_with_polars(csv_path, keys):
+    """Skill counts per filter combination as one lazy, multi-threaded Polars plan"""
+    import polars as pl
+    
+    counts = (pl.scan_csv(csv_path, infer_schema=False)
+              .select(keys + [pl.col('skills').str.strip_chars('[]').str.split(', ').alias('skill')])
+              .explode('skill')
+              .with_columns(pl.col('skill').str.strip_chars("'"))
+              .filter(pl.col('skill').str.len_chars() > 0)
+              .group_by(keys + ['skill'])
+              .len(name='count')
+              .collect())
+    return counts.to_pandas().astype({'count': 'int64'})
+
+
+def build_skills_index(df, csv_path=None):
+    """Write (location, job_title_clean, experience_level, skill) -> count to SKILLS_INDEX_FILE"""
+    keys = [col for col in SKILLS_INDEX_KEYS if col in df.columns]
+    
+    if FAST_IO and csv_path is not None:
+        index = _count_skills_with_polars(csv_path, keys)
+    else:
+        # One row per (posting, skill), then count per filter combination
+        skills = df[keys].assign(skill=df['skills'].str.findall(r"'([^']*)'")).explode('skill')
+        index = (skills.dropna(subset=['skill'])
+                 .groupby(keys + ['skill'], dropna=False, observed=True)
+                 .size()
+                 .reset_index(name='count'))
+    
+    index[keys + ['skill']] = index[keys + ['skill']].astype('category')
+    output_path = os.path.join(PROCESSED_DIR, SKILLS_INDEX_FILE)
+    index.to_parquet(output_path, engine='pyarrow', index=False)
+    return output_path, len(index)
+
 
 def verify_and_prepare_data():
     """Verify that required data files exist and are properly formatted"""
@@ -17,11 +86,12 @@ def verify_and_prepare_data():
     print("DATA PREPARATION FOR STREAMLIT DASHBOARD")
     print("="*80)
     
-    # Check if processed data exists
-    processed_file = 'data/processed/job_market_clean.csv'
+    # Check if processed data exists (one directory scan covers every file check)
+    entries = scan_processed_dir()
+    processed_file = os.path.join(PROCESSED_DIR, 'job_market_clean.csv')
     
-    if not os.path.exists(processed_file):
-        print(f"\n❌ File not found: {processed_file}")
+    if entries.get('job_market_clean.csv') is None or entries['job_market_clean.csv'].st_size == 0:
+        print(f"\n❌ File not found or empty: {processed_file}")
         print("\n📋 To fix this:")
         print("1. Open the Jupyter notebook: notebooks/job_market_analysis.ipynb")
         print("2. Run all cells (Kernel → Restart & Run All)")
@@ -34,7 +104,7 @@ def verify_and_prepare_data():
     print(f"\n✅ Found processed data file")
     
     try:
-        df = pd.read_csv(processed_file)
+        df = read_processed_csv(processed_file)
         print(f"✅ Successfully loaded {len(df):,} rows")
         
         # Check required columns
@@ -58,19 +128,25 @@ def verify_and_prepare_data():
             # Count non-empty skills
             non_empty_skills = df['skills'].notna().sum()
             print(f"   • Rows with skills: {non_empty_skills:,}")
+            
+            try:
+                index_path, index_rows = build_skills_index(df, processed_file)
+                print(f"✅ Skills index written: {index_path} ({index_rows:,} rows)")
+            except ImportError as e:
+                print(f"⚠️ Skills index not written (needs pyarrow): {e}")
         else:
             print(f"\n⚠️ Skills column not found (advanced features may not work)")
         
-        # Check for nulls
-        null_counts = df.isnull().sum()
+        # Check for nulls (count() tallies non-nulls without a boolean copy of the frame)
+        null_counts = len(df) - df.count()
         if null_counts.sum() > 0:
             print(f"\n📋 Missing values:")
             for col, count in null_counts[null_counts > 0].items():
                 print(f"   • {col}: {count} ({count/len(df)*100:.1f}%)")
         
         # Verify top skills file
-        top_skills_file = 'data/processed/top_skills.csv'
-        if os.path.exists(top_skills_file):
+        top_skills_file = os.path.join(PROCESSED_DIR, 'top_skills.csv')
+        if 'top_skills.csv' in entries and entries['top_skills.csv'].st_size > 0:
             skills_df = pd.read_csv(top_skills_file)
             print(f"\n✅ Top skills file found ({len(skills_df)} skills)")
         else:
@@ -111,9 +187,15 @@ def create_sample_processed_data():
     df_clean = df_clean.drop_duplicates()
     df_clean = df_clean.fillna('')
     
+    # Arrow-backed strings make the .str chain below run as pyarrow compute kernels
+    try:
+        df_clean = df_clean.convert_dtypes(dtype_backend='pyarrow')
+    except ImportError:
+        pass
+    
     # Add a job_title_clean column if it doesn't exist
     if 'job_title_clean' not in df_clean.columns:
-        df_clean['job_title_clean'] = df_clean['job_title'].str.lower().str.strip()
+        df_clean['job_title_clean'] = df_clean['job_title'].str.strip().str.lower()
     
     # Save to processed folder
     os.makedirs('data/processed', exist_ok=True)
@@ -5,8 +5,9 @@ Run this script to collect job data for your analysis.
 """
 
 import sys
-from src.job_scraper import create_sample_scraped_data, IndeedScraper, BaytScraper
-from src.database_manager import JobDatabase, load_csv_to_database
+
+# Scraper and database modules pull in pandas/requests, so they are imported
+# inside the menu actions that need them to keep the menu itself fast.
 
 
 def main_menu():
@@ -37,7 +38,8 @@ def generate_sample_data():
     num_jobs = int(num_jobs) if num_jobs.isdigit() else 500
     
     # Generate the data
-    from src.job_scraper import pd, random, datetime
+    import numpy as np
+    from src.job_scraper import pd, datetime
     
     companies = ['Saudi Aramco', 'SDAIA', 'STC', 'Thmanyah', 'Nana', 'Jahez', 
                  'Tamatem', 'Rewaa', 'Hungerstation', 'Noon', 'Mrsool', 'Seez']
@@ -66,32 +68,38 @@ def generate_sample_data():
     
     experience_levels = ['Entry Level', 'Mid Level', 'Senior Level', 'Lead']
     
-    jobs = []
-    for i in range(num_jobs):
-        job = {
-            'job_title': random.choice(job_titles),
-            'company': random.choice(companies),
-            'location': f"{random.choice(cities)}, Saudi Arabia",
-            'description': random.choice(descriptions),
-            'salary': random.choice(['', '15000-25000 SAR', '20000-35000 SAR', '30000-50000 SAR', '40000-60000 SAR']),
-            'experience_level': random.choice(experience_levels),
-            'posted_date': f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-            'source': 'Sample Data',
-            'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        jobs.append(job)
+    salaries = ['', '15000-25000 SAR', '20000-35000 SAR', '30000-50000 SAR', '40000-60000 SAR']
+    
+    # Every possible posted_date (months 1-12, days 1-28) formatted once up front
+    date_table = np.asarray([f'2024-{m:02d}-{d:02d}' for m in range(1, 13) for d in range(1, 29)])
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    # Draw each column in one vectorized call instead of looping per job
+    rng = np.random.default_rng()
+    
+    df = pd.DataFrame({
+        'job_title': rng.choice(np.asarray(job_titles), num_jobs),
+        'company': rng.choice(np.asarray(companies), num_jobs),
+        'location': np.char.add(rng.choice(np.asarray(cities), num_jobs), ', Saudi Arabia'),
+        'description': rng.choice(np.asarray(descriptions), num_jobs),
+        'salary': rng.choice(np.asarray(salaries), num_jobs),
+        'experience_level': rng.choice(np.asarray(experience_levels), num_jobs),
+        'posted_date': rng.choice(date_table, num_jobs),
+        'source': 'Sample Data',
+        'scraped_at': now_str
+    })
     
     # Save to CSV
-    df = pd.DataFrame(jobs)
     filepath = 'data/raw/sample_scraped_jobs.csv'
     df.to_csv(filepath, index=False)
     
-    print(f"\n✅ Generated {len(jobs)} sample jobs")
+    print(f"\n✅ Generated {len(df)} sample jobs")
     print(f"✅ Saved to: {filepath}")
     
     # Ask if user wants to load into database
     load_db = input("\nLoad into database? (y/n): ").strip().lower()
     if load_db == 'y':
+        from src.database_manager import load_csv_to_database
         db = load_csv_to_database(filepath, 'data/jobs.db')
         print("✅ Data loaded into database!")
     
@@ -116,6 +124,7 @@ def scrape_indeed():
     
     print(f"\n🔍 Searching for '{query}' in '{location}'...")
     
+    from src.job_scraper import IndeedScraper
     scraper = IndeedScraper(country='sa')
     jobs = scraper.scrape_jobs(query=query, location=location, max_pages=pages)
     
@@ -143,6 +152,7 @@ def scrape_bayt():
     
     print(f"\n🔍 Searching for '{query}' in '{location}'...")
     
+    from src.job_scraper import BaytScraper
     scraper = BaytScraper()
     jobs = scraper.scrape_jobs(query=query, location=location, max_pages=pages)
     
@@ -164,6 +174,7 @@ def show_database_stats():
     print("="*80)
     
     try:
+        from src.database_manager import JobDatabase
         db = JobDatabase('data/jobs.db')
         stats = db.get_statistics()
         
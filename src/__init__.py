@@ -2,22 +2,24 @@
 Job Market Analysis - Data Collection Module
 """
 
-from .job_scraper import (
-    JobScraper,
-    IndeedScraper,
-    BaytScraper,
-    LinkedInScraper,
-    create_sample_scraped_data,
-    scrape_indeed_jobs,
-    scrape_bayt_jobs,
-    scrape_multiple_sources
-)
+import importlib
 
-from .database_manager import (
-    JobDatabase,
-    load_csv_to_database,
-    merge_multiple_sources
-)
+# Public names -> submodule that defines them. Submodules (and their heavy
+# dependencies such as pandas and requests) are imported on first access.
+_LAZY_IMPORTS = {
+    'JobScraper': '.job_scraper',
+    'IndeedScraper': '.job_scraper',
+    'BaytScraper': '.job_scraper',
+    'LinkedInScraper': '.job_scraper',
+    'create_sample_scraped_data': '.job_scraper',
+    'scrape_indeed_jobs': '.job_scraper',
+    'scrape_bayt_jobs': '.job_scraper',
+    'scrape_multiple_sources': '.job_scraper',
+    'JobDatabase': '.database_manager',
+    'load_csv_to_database': '.database_manager',
+    'merge_multiple_sources': '.database_manager',
+    'merge_csv_files': '.database_manager'
+}
 
 __all__ = [
     'JobScraper',
@@ -30,6 +32,17 @@ __all__ = [
     'scrape_multiple_sources',
     'JobDatabase',
     'load_csv_to_database',
-    'merge_multiple_sources'
+    'merge_multiple_sources',
+    'merge_csv_files'
 ]
 
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -3,202 +3,512 @@ Database Manager for Job Market Analysis
 Handles storage and retrieval of scraped job data
 """
 
+import csv
 import sqlite3
 import pandas as pd
 from datetime import datetime
 import os
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    from .skills import SKILLS, SKILL_BITS, skills_mask
+except ImportError:  # run as a script: python src/database_manager.py
+    from skills import SKILLS, SKILL_BITS, skills_mask
+
+
+# Opt-in Polars fast path for CSV ingestion (set JMA_FAST_IO=1)
+FAST_IO = os.environ.get('JMA_FAST_IO') == '1' and pl is not None
+
+# Listing columns covered by idx_date_covering (date-range queries on these
+# columns are answered from the index alone)
+DATE_INDEX_COLUMNS = [
+    'posted_date', 'job_title', 'company', 'location',
+    'salary', 'experience_level', 'source'
+]
+
+# Lookup indexes on job_postings: index name -> indexed columns
+INDEXES = {
+    'idx_job_title': 'job_title',
+    'idx_location': 'location',
+    'idx_date_covering': ', '.join(DATE_INDEX_COLUMNS),
+}
+
+# job_postings schema; format with table= and if_not_exists=
+JOB_TABLE_SQL = '''
+    CREATE TABLE {if_not_exists} {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_title TEXT NOT NULL,
+        company TEXT,
+        location TEXT,
+        description TEXT,
+        salary TEXT,
+        experience_level TEXT,
+        posted_date TEXT,
+        source TEXT,
+        scraped_at TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        skills_mask INTEGER NOT NULL DEFAULT 0
+    )
+'''
+
+# Columns written by insert_jobs, in table order
+JOB_COLUMNS = [
+    'job_title', 'company', 'location', 'description', 'salary',
+    'experience_level', 'posted_date', 'source', 'scraped_at'
+]
+
+# Column dtypes for job CSV files; low-cardinality columns are categorical
+CSV_SCHEMA = {
+    'job_title': 'string',
+    'company': 'string',
+    'location': 'string',
+    'description': 'string',
+    'salary': 'string',
+    'experience_level': 'category',
+    'posted_date': 'string',
+    'source': 'category',
+    'scraped_at': 'string'
+}
+
+# Columns of the uniq_job index: one row per posting
+UNIQUE_JOB_COLUMNS = ['job_title', 'company', 'location']
+
+# skills_mask is derived from the description when rows are inserted. Only
+# uniq_job conflicts are skipped (OR IGNORE would also drop NOT NULL violations).
+INSERT_JOB_QUERY = (
+    f"INSERT INTO job_postings({', '.join(JOB_COLUMNS)}, skills_mask) "
+    f"VALUES ({', '.join('?' * (len(JOB_COLUMNS) + 1))}) "
+    f"ON CONFLICT({', '.join(UNIQUE_JOB_COLUMNS)}) DO NOTHING"
+)
+
+# Rows read from CSV per chunk during bulk loads
+CSV_CHUNK_SIZE = 50_000
+
+# Rows fetched per cursor.fetchmany call when building DataFrames
+FETCH_BATCH_SIZE = 10_000
+
 
 class JobDatabase:
     """Manage job postings in SQLite database"""
     
     def __init__(self, db_path='data/jobs.db'):
         self.db_path = db_path
-        self.ensure_database_exists()
+        
+        # One connection per instance, reused by every query
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA cache_size=-65536')
+        self._conn.execute('PRAGMA mmap_size=268435456')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        
+        try:
+            self.ensure_database_exists()
+        except BaseException:
+            self._conn.close()
+            raise
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
     
     def ensure_database_exists(self):
-        """Create database and tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
+        """Create database and tables if they don't exist, migrating older databases"""
+        conn = self._conn
         cursor = conn.cursor()
         
-        # Create job_postings table
+        # One transaction (SQLite DDL is transactional): if any migration step
+        # fails, the database file is left exactly as it was
+        with conn:
+            cursor.execute('BEGIN')
+            self._create_schema(cursor)
+        
+        print(f"✅ Database initialized: {self.db_path}")
+    
+    def _create_schema(self, cursor):
+        """Create or migrate the job_postings table, its indexes and FTS index"""
+        cursor.execute(JOB_TABLE_SQL.format(table='job_postings', if_not_exists='IF NOT EXISTS'))
+        columns = [row[1] for row in cursor.execute('PRAGMA table_info(job_postings)')]
+        
+        if 'id' not in columns:
+            # Written by DataFrame.to_sql (older JobScraper.save_to_database):
+            # no id key, so rebuild it with the proper schema
+            self._rebuild_table(cursor, columns)
+        elif 'skills_mask' not in columns:
+            # Older databases predate skills_mask: add it and fill it from descriptions
+            cursor.execute('ALTER TABLE job_postings ADD COLUMN skills_mask INTEGER NOT NULL DEFAULT 0')
+            self._conn.create_function('skills_mask', 1, skills_mask, deterministic=True)
+            cursor.execute('UPDATE job_postings SET skills_mask = skills_mask(description)')
+        
+        # Create index for faster queries
+        cursor.execute('DROP INDEX IF EXISTS idx_posted_date')  # superseded by idx_date_covering
+        self.create_indexes(cursor)
+        
+        # One row per (job_title, company, location); inserts skip duplicates.
+        # One-time migration: databases created before uniq_job may hold
+        # duplicates, which must go before the unique index can be built.
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uniq_job'"
+        )
+        if cursor.fetchone() is None:
+            deleted = self._delete_duplicates(cursor)
+            if deleted:
+                print(f"⚠️ Removed {deleted} duplicate jobs while adding the unique job index")
+            cursor.execute('DROP INDEX IF EXISTS idx_dedup')
+            cursor.execute(f'''
+                CREATE UNIQUE INDEX uniq_job
+                ON job_postings({', '.join(UNIQUE_JOB_COLUMNS)})
+            ''')
+        
+        # Full-text index over the searchable text columns
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_postings_fts'"
+        )
+        fts_exists = cursor.fetchone() is not None
+        
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS job_postings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_title TEXT NOT NULL,
-                company TEXT,
-                location TEXT,
-                description TEXT,
-                salary TEXT,
-                experience_level TEXT,
-                posted_date TEXT,
-                source TEXT,
-                scraped_at TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            CREATE VIRTUAL TABLE IF NOT EXISTS job_postings_fts USING fts5(
+                job_title, company, location, description,
+                content='job_postings', content_rowid='id'
             )
         ''')
         
-        # Create index for faster queries
+        # Keep the FTS index in sync with job_postings
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_job_title 
-            ON job_postings(job_title)
+            CREATE TRIGGER IF NOT EXISTS job_postings_ai AFTER INSERT ON job_postings BEGIN
+                INSERT INTO job_postings_fts(rowid, job_title, company, location, description)
+                VALUES (new.id, new.job_title, new.company, new.location, new.description);
+            END
         ''')
         
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_location 
-            ON job_postings(location)
+            CREATE TRIGGER IF NOT EXISTS job_postings_ad AFTER DELETE ON job_postings BEGIN
+                INSERT INTO job_postings_fts(job_postings_fts, rowid, job_title, company, location, description)
+                VALUES ('delete', old.id, old.job_title, old.company, old.location, old.description);
+            END
         ''')
         
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_posted_date 
-            ON job_postings(posted_date)
+            CREATE TRIGGER IF NOT EXISTS job_postings_au AFTER UPDATE ON job_postings BEGIN
+                INSERT INTO job_postings_fts(job_postings_fts, rowid, job_title, company, location, description)
+                VALUES ('delete', old.id, old.job_title, old.company, old.location, old.description);
+                INSERT INTO job_postings_fts(rowid, job_title, company, location, description)
+                VALUES (new.id, new.job_title, new.company, new.location, new.description);
+            END
         ''')
         
-        conn.commit()
-        conn.close()
+        # Index rows that were stored before the FTS table existed
+        if not fts_exists:
+            cursor.execute("INSERT INTO job_postings_fts(job_postings_fts) VALUES ('rebuild')")
+    
+    def _rebuild_table(self, cursor, columns):
+        """Copy a job_postings table without an id column into the proper schema"""
+        cursor.execute('DROP TABLE IF EXISTS job_postings_new')
+        cursor.execute(JOB_TABLE_SQL.format(table='job_postings_new', if_not_exists=''))
         
-        print(f"✅ Database initialized: {self.db_path}")
+        # Columns the old table lacks are stored as NULL; job_title is NOT NULL now
+        select = ', '.join(col if col in columns else 'NULL' for col in JOB_COLUMNS)
+        self._conn.create_function('skills_mask', 1, skills_mask, deterministic=True)
+        cursor.execute(f'''
+            INSERT INTO job_postings_new({', '.join(JOB_COLUMNS)}, skills_mask)
+            SELECT {select}, skills_mask({'description' if 'description' in columns else 'NULL'})
+            FROM job_postings
+            WHERE {'job_title IS NOT NULL' if 'job_title' in columns else '0'}
+        ''')
+        copied = cursor.rowcount
+        total = cursor.execute('SELECT COUNT(*) FROM job_postings').fetchone()[0]
+        
+        cursor.execute('DROP TABLE job_postings')
+        cursor.execute('ALTER TABLE job_postings_new RENAME TO job_postings')
+        
+        print(f"⚠️ Rebuilt job_postings with an id column ({copied} rows kept, "
+              f"{total - copied} without a job title dropped)")
+    
+    def create_indexes(self, cursor):
+        """Create the lookup indexes on job_postings"""
+        for name, columns in INDEXES.items():
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON job_postings({columns})')
+    
+    def drop_indexes(self, cursor):
+        """Drop the lookup indexes (used to speed up bulk loads)"""
+        for name in INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {name}')
     
     def insert_jobs(self, jobs_df):
         """
         Insert job postings from DataFrame
         
+        Jobs already in the database (same title, company and location)
+        are skipped.
+        
         Args:
             jobs_df: pandas DataFrame with job data
+        
+        Returns:
+            Number of new jobs inserted
         """
-        conn = sqlite3.connect(self.db_path)
-        jobs_df.to_sql('job_postings', conn, if_exists='append', index=False)
-        conn.commit()
-        conn.close()
+        # One transaction: committed on success, rolled back on any error so the
+        # shared connection is never left inside an open transaction
+        conn = self._conn
+        with conn:
+            conn.execute('BEGIN')
+            inserted = self._insert_rows(jobs_df)
+        
+        print(f"✅ Inserted {inserted} jobs into database "
+              f"({len(jobs_df) - inserted} duplicates skipped)")
+        return inserted
+    
+    def insert_job_records(self, jobs):
+        """
+        Insert job postings from a list of dicts, skipping duplicates
+        
+        Same as insert_jobs, without building a DataFrame first.
+        
+        Returns:
+            Number of new jobs inserted
+        """
+        rows = (
+            tuple(job.get(col) for col in JOB_COLUMNS) + (skills_mask(job.get('description')),)
+            for job in jobs
+        )
+        
+        conn = self._conn
+        with conn:
+            conn.execute('BEGIN')
+            inserted = conn.executemany(INSERT_JOB_QUERY, rows).rowcount
         
-        print(f"✅ Inserted {len(jobs_df)} jobs into database")
+        print(f"✅ Inserted {inserted} jobs into database "
+              f"({len(jobs) - inserted} duplicates skipped)")
+        return inserted
+    
+    def _insert_rows(self, jobs_df):
+        """Insert the rows of jobs_df, skipping duplicates, without committing"""
+        # Align to the table columns once; missing values are stored as NULL
+        rows = jobs_df.reindex(columns=JOB_COLUMNS).astype(object)
+        rows = rows.where(rows.notna(), None)
+        rows['skills_mask'] = rows['description'].map(skills_mask)
+        
+        cursor = self._conn.executemany(INSERT_JOB_QUERY, rows.itertuples(index=False, name=None))
+        return cursor.rowcount
     
     def get_all_jobs(self):
         """Retrieve all jobs from database"""
-        conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query('SELECT * FROM job_postings', conn)
-        conn.close()
-        return df
+        cursor = self._conn.execute('SELECT * FROM job_postings')
+        columns = [col[0] for col in cursor.description]
+        
+        # Transpose each fetched batch into per-column lists and build the
+        # DataFrame once, skipping read_sql_query's row-wise conversion
+        data = {col: [] for col in columns}
+        while batch := cursor.fetchmany(FETCH_BATCH_SIZE):
+            for col, values in zip(columns, zip(*batch)):
+                data[col].extend(values)
+        
+        return pd.DataFrame(data, columns=columns)
     
-    def get_jobs_by_title(self, job_title):
-        """Get jobs matching a specific title"""
-        conn = sqlite3.connect(self.db_path)
-        query = 'SELECT * FROM job_postings WHERE job_title LIKE ?'
-        df = pd.read_sql_query(query, conn, params=(f'%{job_title}%',))
-        conn.close()
+    def _search(self, column, text, prefix=True):
+        """Full-text search on one column of the FTS index (prefix match per word if prefix)"""
+        words = text.split()
+        if not words:
+            return self.get_all_jobs()
+        
+        conn = self._conn
+        
+        # The FTS tokenizer drops punctuation, so "C++" would become the prefix
+        # query c* (matching "Cloud"); punctuated terms use a substring scan
+        if not all(word.isalnum() for word in words):
+            pattern = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            query = f"SELECT * FROM job_postings WHERE {column} LIKE ? ESCAPE '\\' ORDER BY id"
+            return pd.read_sql_query(query, conn, params=(f'%{pattern}%',))
+        
+        # Quote each word so user input can't inject FTS5 query syntax
+        star = '*' if prefix else ''
+        terms = [f'{column}:"{word}"{star}' for word in words]
+        query = '''
+            SELECT jp.* FROM job_postings jp
+            JOIN job_postings_fts f ON f.rowid = jp.id
+            WHERE job_postings_fts MATCH ?
+            ORDER BY jp.id
+        '''
+        df = pd.read_sql_query(query, conn, params=(' AND '.join(terms),))
         return df
     
-    def get_jobs_by_location(self, location):
-        """Get jobs in a specific location"""
-        conn = sqlite3.connect(self.db_path)
-        query = 'SELECT * FROM job_postings WHERE location LIKE ?'
-        df = pd.read_sql_query(query, conn, params=(f'%{location}%',))
-        conn.close()
-        return df
+    def get_jobs_by_title(self, job_title, prefix=True):
+        """Get jobs matching a specific title (prefix=False: whole words only)"""
+        return self._search('job_title', job_title, prefix)
     
-    def get_jobs_by_date_range(self, start_date, end_date):
-        """Get jobs posted within a date range"""
-        conn = sqlite3.connect(self.db_path)
-        query = '''
-            SELECT * FROM job_postings 
+    def get_jobs_by_location(self, location, prefix=True):
+        """Get jobs in a specific location (prefix=False: whole words only)"""
+        return self._search('location', location, prefix)
+    
+    def get_jobs_by_date_range(self, start_date, end_date, columns=None):
+        """
+        Get jobs posted within a date range
+        
+        Args:
+            start_date: First posted_date to include (YYYY-MM-DD)
+            end_date: Last posted_date to include (YYYY-MM-DD)
+            columns: Columns to return (default: all). Restricting them to
+                DATE_INDEX_COLUMNS lets SQLite answer from the index alone.
+        """
+        conn = self._conn
+        select = ', '.join(columns) if columns else '*'
+        query = f'''
+            SELECT {select} FROM job_postings 
             WHERE posted_date BETWEEN ? AND ?
         '''
         df = pd.read_sql_query(query, conn, params=(start_date, end_date))
-        conn.close()
         return df
     
+    def get_jobs_with_skill(self, skill):
+        """Get jobs whose description mentions a canonical skill (see skills.SKILLS)"""
+        bit = SKILL_BITS[skill.lower()]
+        conn = self._conn
+        query = 'SELECT * FROM job_postings WHERE skills_mask & ? != 0'
+        df = pd.read_sql_query(query, conn, params=(1 << bit,))
+        return df
+    
+    def get_skill_counts(self):
+        """Count jobs per canonical skill in a single pass over skills_mask"""
+        sums = ', '.join(f'SUM((skills_mask >> {bit}) & 1)' for bit in range(len(SKILLS)))
+        counts = self._conn.execute(f'SELECT {sums} FROM job_postings').fetchone()
+        
+        return sorted(
+            ({'skill': skill, 'count': count or 0} for skill, count in zip(SKILLS, counts)),
+            key=lambda item: item['count'], reverse=True
+        )
+    
     def get_recent_jobs(self, limit=100):
         """Get most recently scraped jobs"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         query = f'''
             SELECT * FROM job_postings 
             ORDER BY scraped_at DESC 
             LIMIT {limit}
         '''
         df = pd.read_sql_query(query, conn)
-        conn.close()
         return df
     
     def remove_duplicates(self):
         """Remove duplicate job postings"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
-        # Keep only the first occurrence of each unique job
-        cursor.execute('''
-            DELETE FROM job_postings 
-            WHERE id NOT IN (
-                SELECT MIN(id) 
-                FROM job_postings 
-                GROUP BY job_title, company, location
-            )
-        ''')
-        
-        deleted = cursor.rowcount
+        # New inserts are already deduplicated by uniq_job; this catches rows with
+        # NULL key columns, which the unique index treats as distinct
+        deleted = self._delete_duplicates(cursor)
         conn.commit()
-        conn.close()
         
         print(f"✅ Removed {deleted} duplicate jobs")
         return deleted
     
+    def _delete_duplicates(self, cursor):
+        """Delete all but the first row of each (job_title, company, location)"""
+        # Window functions need SQLite 3.25+
+        cursor.execute('''
+            DELETE FROM job_postings 
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY job_title, company, location ORDER BY id
+                    ) AS rn
+                    FROM job_postings
+                )
+                WHERE rn > 1
+            )
+        ''')
+        return cursor.rowcount
+    
     def get_statistics(self):
         """Get database statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         
         stats = {}
         
+        # Single grouped scan; every statistic below is derived from its small result
+        rows = conn.execute('''
+            SELECT source, location, COUNT(*), MIN(posted_date), MAX(posted_date)
+            FROM job_postings
+            GROUP BY source, location
+        ''').fetchall()
+        
+        by_source, by_location = {}, {}
+        for source, location, count, _, _ in rows:
+            by_source[source] = by_source.get(source, 0) + count
+            by_location[location] = by_location.get(location, 0) + count
+        
         # Total jobs
-        cursor = conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM job_postings')
-        stats['total_jobs'] = cursor.fetchone()[0]
+        stats['total_jobs'] = sum(by_source.values())
         
         # Jobs by source
-        df = pd.read_sql_query('''
-            SELECT source, COUNT(*) as count 
-            FROM job_postings 
-            GROUP BY source
-        ''', conn)
-        stats['jobs_by_source'] = df.to_dict('records')
+        stats['jobs_by_source'] = [
+            {'source': source, 'count': count} for source, count in by_source.items()
+        ]
         
         # Jobs by location
-        df = pd.read_sql_query('''
-            SELECT location, COUNT(*) as count 
-            FROM job_postings 
-            GROUP BY location 
-            ORDER BY count DESC 
-            LIMIT 10
-        ''', conn)
-        stats['top_locations'] = df.to_dict('records')
+        top_locations = sorted(by_location.items(), key=lambda item: item[1], reverse=True)[:10]
+        stats['top_locations'] = [
+            {'location': location, 'count': count} for location, count in top_locations
+        ]
         
         # Date range
-        cursor.execute('''
-            SELECT MIN(posted_date), MAX(posted_date) 
-            FROM job_postings
-        ''')
-        min_date, max_date = cursor.fetchone()
-        stats['date_range'] = {'earliest': min_date, 'latest': max_date}
+        earliest = [row[3] for row in rows if row[3] is not None]
+        latest = [row[4] for row in rows if row[4] is not None]
+        stats['date_range'] = {
+            'earliest': min(earliest, default=None),
+            'latest': max(latest, default=None)
+        }
         
-        conn.close()
         return stats
     
     def export_to_csv(self, output_path='data/processed/database_export.csv'):
         """Export entire database to CSV"""
-        df = self.get_all_jobs()
-        df.to_csv(output_path, index=False)
-        print(f"✅ Exported {len(df)} jobs to {output_path}")
+        # Stream rows straight from the cursor instead of building a DataFrame
+        cursor = self._conn.execute('SELECT * FROM job_postings')
+        count = 0
+        
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, dialect='excel', lineterminator='\n')
+            writer.writerow([col[0] for col in cursor.description])
+            for row in cursor:
+                writer.writerow(row)
+                count += 1
+        
+        print(f"✅ Exported {count} jobs to {output_path}")
         return output_path
     
     def clear_database(self):
         """Clear all data from database (use with caution!)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         cursor.execute('DELETE FROM job_postings')
         conn.commit()
-        conn.close()
         
         print("⚠️ Database cleared!")
 
 
+def _iter_csv_chunks(csv_path):
+    """Yield a CSV file as DataFrames of at most CSV_CHUNK_SIZE rows"""
+    if FAST_IO:
+        # Streaming scan: only about one chunk of the file is in memory at a time
+        batches = pl.scan_csv(csv_path, infer_schema=False).collect_batches(
+            chunk_size=CSV_CHUNK_SIZE, lazy=True
+        )
+        for chunk in batches:
+            yield chunk.to_pandas(use_pyarrow_extension_array=True)
+    else:
+        yield from pd.read_csv(csv_path, chunksize=CSV_CHUNK_SIZE, dtype=CSV_SCHEMA, engine='c')
+
+
 def load_csv_to_database(csv_path, db_path='data/jobs.db'):
     """
     Load jobs from CSV file into database
@@ -209,16 +519,37 @@ def load_csv_to_database(csv_path, db_path='data/jobs.db'):
     """
     print(f"📥 Loading data from {csv_path}...")
     
-    # Read CSV
-    df = pd.read_csv(csv_path)
-    
     # Initialize database
     db = JobDatabase(db_path)
     
-    # Insert jobs
-    db.insert_jobs(df)
+    conn = db._conn
+    cursor = conn.cursor()
     
-    print(f"✅ Successfully loaded {len(df)} jobs into database")
+    # Index maintenance dominates bulk inserts, so rebuild indexes once at the end
+    db.drop_indexes(cursor)
+    
+    # Stream the CSV in chunks so memory stays bounded by the chunk size
+    total = inserted = 0
+    try:
+        conn.execute('BEGIN')
+        for chunk in _iter_csv_chunks(csv_path):
+            inserted += db._insert_rows(chunk)
+            total += len(chunk)
+    except BaseException:
+        # All or nothing: drop the partial load, restore the indexes, re-raise
+        conn.rollback()
+        db.create_indexes(cursor)
+        conn.commit()
+        raise
+    
+    db.create_indexes(cursor)
+    conn.commit()
+    
+    # Refresh planner statistics so the rebuilt indexes get used
+    conn.execute('ANALYZE')
+    
+    print(f"✅ Successfully loaded {inserted} jobs into database "
+          f"({total - inserted} duplicates skipped)")
     return db
 
 
@@ -229,37 +560,154 @@ def merge_multiple_sources(csv_files, output_path='data/raw/merged_jobs.csv'):
     Args:
         csv_files: List of CSV file paths
         output_path: Where to save merged data
+    
+    Returns:
+        The merged DataFrame, or None if there was nothing to merge
     """
+    if FAST_IO:
+        merged_path = _merge_with_polars(csv_files, output_path)
+        return None if merged_path is None else pd.read_csv(merged_path)
+    
     all_dfs = []
     
     for csv_file in csv_files:
-        if os.path.exists(csv_file):
+        if not os.path.exists(csv_file):
+            print(f"⚠️ File not found: {csv_file}")
+        elif not _read_csv_header(csv_file):
+            print(f"⚠️ Empty file skipped: {csv_file}")
+        else:
             df = pd.read_csv(csv_file)
             all_dfs.append(df)
             print(f"✅ Loaded {len(df)} jobs from {csv_file}")
+    
+    if not all_dfs:
+        print("❌ No data to merge")
+        return None
+    
+    merged_df = pd.concat(all_dfs, ignore_index=True)
+    
+    # Remove duplicates
+    initial_count = len(merged_df)
+    merged_df = merged_df.drop_duplicates(subset=UNIQUE_JOB_COLUMNS, ignore_index=True)
+    removed = initial_count - len(merged_df)
+    
+    # Save
+    merged_df.to_csv(output_path, index=False)
+    
+    print(f"\n✅ Merged {len(all_dfs)} files")
+    print(f"✅ Total jobs: {len(merged_df)}")
+    print(f"✅ Duplicates removed: {removed}")
+    print(f"✅ Saved to: {output_path}")
+    
+    return merged_df
+
+
+def merge_csv_files(csv_files, output_path='data/raw/merged_jobs.csv'):
+    """
+    Merge multiple CSV files into one without loading them into memory
+    
+    Same as merge_multiple_sources, for inputs too large for a DataFrame.
+    
+    Returns:
+        Path to the merged CSV, or None if there was nothing to merge
+    """
+    if FAST_IO:
+        return _merge_with_polars(csv_files, output_path)
+    
+    existing = []
+    for csv_file in csv_files:
+        if os.path.exists(csv_file):
+            existing.append(csv_file)
         else:
             print(f"⚠️ File not found: {csv_file}")
     
-    if all_dfs:
-        merged_df = pd.concat(all_dfs, ignore_index=True)
-        
-        # Remove duplicates
-        initial_count = len(merged_df)
-        merged_df = merged_df.drop_duplicates(subset=['job_title', 'company', 'location'])
-        removed = initial_count - len(merged_df)
-        
-        # Save
-        merged_df.to_csv(output_path, index=False)
-        
-        print(f"\n✅ Merged {len(all_dfs)} files")
-        print(f"✅ Total jobs: {len(merged_df)}")
-        print(f"✅ Duplicates removed: {removed}")
-        print(f"✅ Saved to: {output_path}")
+    if not existing:
+        print("❌ No data to merge")
+        return None
+    
+    # Files are streamed row by row in csv_files order, so the first
+    # occurrence wins. Only the dedup keys are kept in memory. The output
+    # columns are the union of all headers in first-seen order, as pd.concat
+    # and Polars produce
+    headers = [_read_csv_header(csv_file) for csv_file in existing]
+    fieldnames = list(dict.fromkeys(col for header in headers for col in header))
+    if not fieldnames:
+        print("❌ No data to merge")
+        return None
+    
+    seen = set()
+    initial_count = 0
+    merged_files = 0
+    
+    with open(output_path, 'w', newline='', encoding='utf-8') as out:
+        # extrasaction only drops the None key of rows longer than their header
+        writer = csv.DictWriter(out, fieldnames=fieldnames, restval='',
+                                extrasaction='ignore', lineterminator='\n')
+        writer.writeheader()
         
-        return merged_df
-    else:
+        for csv_file in existing:
+            file_count = 0
+            with open(csv_file, newline='', encoding='utf-8') as inp:
+                for row in csv.DictReader(inp):
+                    file_count += 1
+                    key = (row.get('job_title'), row.get('company'), row.get('location'))
+                    if key not in seen:
+                        seen.add(key)
+                        writer.writerow(row)
+            
+            initial_count += file_count
+            merged_files += file_count > 0
+            print(f"✅ Loaded {file_count} jobs from {csv_file}")
+    
+    removed = initial_count - len(seen)
+    
+    print(f"\n✅ Merged {merged_files} files")
+    print(f"✅ Total jobs: {len(seen)}")
+    print(f"✅ Duplicates removed: {removed}")
+    print(f"✅ Saved to: {output_path}")
+    
+    return output_path
+
+
+def _read_csv_header(csv_file):
+    """Column names of a CSV file ([] for an empty file)"""
+    with open(csv_file, newline='', encoding='utf-8') as inp:
+        return next(csv.reader(inp), [])
+
+
+def _merge_with_polars(csv_files, output_path):
+    """Polars version of merge_csv_files using lazy scans"""
+    frames = []
+    
+    for csv_file in csv_files:
+        if not os.path.exists(csv_file):
+            print(f"⚠️ File not found: {csv_file}")
+        elif not _read_csv_header(csv_file):
+            print(f"⚠️ Empty file skipped: {csv_file}")
+        else:
+            frames.append(pl.scan_csv(csv_file, infer_schema=False))
+            print(f"✅ Queued {csv_file}")
+    
+    if not frames:
         print("❌ No data to merge")
         return None
+    
+    combined = pl.concat(frames, how='diagonal_relaxed')
+    initial_count = combined.select(pl.len()).collect().item()
+    
+    # Hash-based dedup, streamed straight to the output file
+    combined.unique(
+        subset=['job_title', 'company', 'location'], keep='first', maintain_order=True
+    ).sink_csv(output_path)
+    total = pl.scan_csv(output_path, infer_schema=False).select(pl.len()).collect().item()
+    removed = initial_count - total
+    
+    print(f"\n✅ Merged {len(frames)} files")
+    print(f"✅ Total jobs: {total}")
+    print(f"✅ Duplicates removed: {removed}")
+    print(f"✅ Saved to: {output_path}")
+    
+    return output_path
 
 
 if __name__ == '__main__':
@@ -10,43 +10,463 @@ Collects job postings from multiple sources
 - For production use, consider services like ScraperAPI or Bright Data
 """
 
+import asyncio
+import csv
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
+import numpy as np
 import time
 import random
 import json
-from datetime import datetime
-import sqlite3
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import re
 from typing import List, Dict
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    from .database_manager import JobDatabase
+except ImportError:  # run as a script: python src/job_scraper.py
+    from database_manager import JobDatabase
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Parse result pages with selectolax's C parser when it is installed;
+# set JMA_PARSER=bs4 to force the BeautifulSoup path
+USE_SELECTOLAX = LexborHTMLParser is not None and os.environ.get('JMA_PARSER') != 'bs4'
+
+# Job cards and their fields as CSS selectors (Note: HTML structure may change)
+INDEED_CARD = 'div.job_seen_beacon'
+INDEED_FIELDS = {
+    'job_title': 'h2.jobTitle',
+    'company': 'span.companyName',
+    'location': 'div.companyLocation',
+    'description': 'div.job-snippet'
+}
+BAYT_CARD = 'li.has-pointer-d'
+BAYT_FIELDS = {
+    'job_title': 'h2',
+    'company': 'b.t-default',
+    'location': 'span.t-mute'
+}
+
+
+def _has_class(name):
+    """SoupStrainer attribute matcher for elements whose class list contains name"""
+    return lambda value: value is not None and name in value.split()
+
+
+# BeautifulSoup only builds the job cards of a result page (matched on class
+# tokens, as the CSS selectors do: a strainer's class_ compares the whole attribute)
+_INDEED_STRAINER = SoupStrainer('div', attrs={'class': _has_class('job_seen_beacon')})
+_BAYT_STRAINER = SoupStrainer('li', attrs={'class': _has_class('has-pointer-d')})
+
+
+def clean_text(text):
+    """Clean and normalize text"""
+    if not text:
+        return ""
+    # Remove extra whitespace
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def _parse_page(html, card_selector, strainer, fields, source, scraped_at):
+    """Parse one result page; returns (number of cards, list of job dicts)"""
+    if scraped_at is None:
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    if USE_SELECTOLAX:
+        job_cards = LexborHTMLParser(html).css(card_selector)
+        get_text = _selectolax_text
+    else:
+        # The strained tree holds only the job cards, as top-level elements
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+        job_cards = soup.find_all(True, recursive=False)
+        get_text = _bs4_text
+    
+    jobs = []
+    for card in job_cards:
+        job_data = _parse_job_card(card, fields, source, get_text, scraped_at)
+        if job_data:
+            jobs.append(job_data)
+    return len(job_cards), jobs
+
+
+# Page parsers are plain top-level functions so they can run in a process pool
+def parse_indeed_page(html, scraped_at=None):
+    """Parse an Indeed result page into job dicts"""
+    return _parse_page(html, INDEED_CARD, _INDEED_STRAINER, INDEED_FIELDS, 'Indeed', scraped_at)
+
+
+def parse_bayt_page(html, scraped_at=None):
+    """Parse a Bayt result page into job dicts"""
+    return _parse_page(html, BAYT_CARD, _BAYT_STRAINER, BAYT_FIELDS, 'Bayt', scraped_at)
+
+
+def _selectolax_text(card, selector):
+    """Text of the first node under card matching selector, or None"""
+    node = card.css_first(selector)
+    return node.text() if node is not None else None
+
+
+def _bs4_text(card, selector):
+    """Text of the first element under card matching selector, or None"""
+    elem = card.select_one(selector)
+    return elem.text if elem else None
+
+
+def _parse_job_card(card, fields, source, get_text, scraped_at):
+    """Parse individual job card; scraped_at is the run's timestamp string"""
+    try:
+        job_data = {
+            'job_title': '',
+            'company': '',
+            'location': '',
+            'description': '',
+            'salary': '',  # Sites often don't show salary
+            'experience_level': '',
+            'posted_date': scraped_at[:10],
+            'source': source,
+            'scraped_at': scraped_at
+        }
+        
+        # Extract details (structure may vary)
+        for field, selector in fields.items():
+            text = get_text(card, selector)
+            if text:
+                job_data[field] = clean_text(text)
+        
+        return job_data
+        
+    except Exception as e:
+        print(f"⚠️ Error parsing job card: {str(e)}")
+        return None
+
+
+# Async fetch retries: status codes worth retrying and the backoff bounds (seconds)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_FETCH_ATTEMPTS = 4
+BACKOFF_MIN, BACKOFF_MAX = 1, 30
+
+
+# Runs of at least this many pages parse in a shared process pool; for fewer,
+# starting workers costs more than the parsing they would take off the loop
+PARSE_POOL_MIN_PAGES = 5
+_PARSE_POOL = None
+
+
+def _parse_pool():
+    """The page-parsing process pool shared by every scraper, started on first use"""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 2))
+    return _PARSE_POOL
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` requests per second to one host"""
+    
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    def pause(self, seconds):
+        """Hold back every request to the host for about `seconds`"""
+        self.tokens = min(self.tokens, 0) - seconds * self.rate
+
+
+def _retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _write_jobs_csv(filepath, jobs):
+    """Stream a list of job dicts to CSV"""
+    # Columns in first-seen order, as pd.DataFrame(jobs) would have them
+    fieldnames = list(dict.fromkeys(key for job in jobs for key in job))
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(jobs)
+
+
+def _can_run_async():
+    """True when aiohttp is installed and asyncio.run() can be called here"""
+    if aiohttp is None:
+        return False
+    # asyncio.run() can't be nested (e.g. inside Jupyter), so fall back there
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
 
 
 class JobScraper:
     """Base class for job scraping functionality"""
     
-    def __init__(self, output_dir='data/raw'):
+    # Cards on a full result page, if the site has a fixed page size
+    page_size = None
+    
+    # Treat a page with fewer than page_size cards as the last one. Off by
+    # default: sites often return short pages mid-results (removed or
+    # sponsored listings), so only an empty page reliably ends a search
+    stop_on_short_page = False
+    
+    # Requests per second the async scraper sends to one host
+    rate_limit = 1.0
+    
+    # Top-level function turning a result page (and the run's scraped_at
+    # timestamp) into (number of cards, jobs); set by subclasses
+    page_parser = None
+    
+    def __init__(self, output_dir='data/raw', cache=False):
         self.output_dir = output_dir
         self.jobs = []
+        # (job_title, company, location, source) of every job in self.jobs
+        self._seen = set()
+        self.cache = cache and CachedSession is not None
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
+        
+        # One pooled session so page fetches reuse the TCP/TLS connection;
+        # with cache=True, already-seen pages are answered from a local SQLite cache
+        if self.cache:
+            self.session = CachedSession(
+                os.path.join(output_dir, 'http_cache'),
+                backend='sqlite',
+                expire_after=timedelta(hours=1),
+                allowable_codes=[200],
+                stale_if_error=True,
+                cache_control=True
+            )
+        else:
+            if cache:
+                print("⚠️ requests-cache is not installed, HTTP caching disabled")
+            self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def add_delay(self, min_seconds=2, max_seconds=5):
         """Add random delay between requests to be respectful"""
         time.sleep(random.uniform(min_seconds, max_seconds))
     
+    def _page_url(self, query, location, page):
+        """URL of result page `page` (1-based); implemented by subclasses"""
+        raise NotImplementedError
+    
+    def _scrape(self, query, location, max_pages):
+        """Scrape result pages, concurrently with aiohttp when it is available"""
+        # The cached session only serves the sequential path
+        if _can_run_async() and not self.cache:
+            asyncio.run(self.scrape_jobs_async(query, location, max_pages))
+        else:
+            self._scrape_sequential(query, location, max_pages)
+        
+        print(f"\n✅ Total jobs scraped: {len(self.jobs)}")
+        return self.jobs
+    
+    def _is_last_page(self, num_cards):
+        """Whether a page with num_cards cards is short enough to end the scrape"""
+        return self.stop_on_short_page and self.page_size is not None and num_cards < self.page_size
+    
+    def _scrape_sequential(self, query, location, max_pages):
+        """Fetch result pages one at a time with requests"""
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        for page in range(1, max_pages + 1):
+            url = self._page_url(query, location, page)
+            
+            try:
+                response = self.session.get(url, timeout=10)
+                parsed = self.page_parser(response.content, scraped_at) if response.status_code == 200 else None
+                if not self._process_page(page, response.status_code, parsed):
+                    break
+                if self._is_last_page(parsed[0]):
+                    break
+                # No need to be polite to our own cache
+                if not getattr(response, 'from_cache', False):
+                    self.add_delay()
+                    
+            except Exception as e:
+                print(f"❌ Error on page {page}: {str(e)}")
+                break
+    
+    async def scrape_jobs_async(self, query, location, max_pages):
+        """
+        Fetch and parse result pages in order, stopping at the last populated one
+        
+        Each host gets at most `rate_limit` requests per second; 429/5xx
+        responses are retried after their Retry-After or an exponential
+        backoff. Long runs parse pages in a shared process pool, off the event
+        loop, so several scrapers can run on one loop (see
+        scrape_multiple_sources_async); short ones parse inline.
+        """
+        connector = aiohttp.TCPConnector(limit_per_host=2)
+        timeout = aiohttp.ClientTimeout(total=10)
+        limiter = TokenBucket(self.rate_limit)
+        # One timestamp for the whole run instead of one per card
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        pool = _parse_pool() if max_pages >= PARSE_POOL_MIN_PAGES else None
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector,
+                                         timeout=timeout) as session:
+            async for page, status, parsed in self._pages(session, limiter, pool, scraped_at,
+                                                           query, location, max_pages):
+                if not self._process_page(page, status, parsed):
+                    break
+        
+        return self.jobs
+    
+    async def _pages(self, session, limiter, pool, scraped_at, query, location, max_pages):
+        """
+        Yield (page, status, parsed page) for consecutive result pages
+        
+        Page p+1 is only requested once page p came back full, so no request
+        is spent past the last populated page; it is then fetched while page p
+        is being handed back (one page of lookahead).
+        """
+        def fetch(page):
+            url = self._page_url(query, location, page)
+            return asyncio.create_task(self._fetch_and_parse(session, limiter, pool, scraped_at, url))
+        
+        task = fetch(1)
+        for page in range(1, max_pages + 1):
+            try:
+                status, parsed = await task
+            except Exception as e:
+                print(f"❌ Error on page {page}: {str(e)}")
+                return
+            
+            num_cards = parsed[0] if status == 200 else 0
+            has_more = num_cards > 0 and not self._is_last_page(num_cards)
+            if has_more and page < max_pages:
+                task = fetch(page + 1)
+            
+            yield page, status, parsed
+            if not has_more:
+                return
+    
+    async def _fetch_and_parse(self, session, limiter, pool, scraped_at, url):
+        """GET one page and parse it (in the pool, if any); returns (status, parsed page)"""
+        status, content = await self._fetch(session, limiter, url)
+        
+        if status != 200:
+            return status, None
+        if pool is None:
+            return status, self.page_parser(content, scraped_at)
+        loop = asyncio.get_running_loop()
+        return status, await loop.run_in_executor(pool, self.page_parser, content, scraped_at)
+    
+    async def _fetch(self, session, limiter, url):
+        """GET one page under the host's rate limit, retrying 429/5xx and network errors"""
+        for attempt in range(MAX_FETCH_ATTEMPTS):
+            await limiter.acquire()
+            retry_after = None
+            try:
+                async with session.get(url) as response:
+                    status = response.status
+                    if status not in RETRY_STATUSES:
+                        return status, await response.read()
+                    retry_after = _retry_after(response.headers.get('Retry-After'))
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == MAX_FETCH_ATTEMPTS - 1:
+                    raise
+            
+            if attempt == MAX_FETCH_ATTEMPTS - 1 or (retry_after or 0) > BACKOFF_MAX:
+                break
+            if retry_after is not None:
+                # The server said when to come back: slow the whole host down
+                limiter.pause(retry_after)
+            else:
+                await asyncio.sleep(min(BACKOFF_MAX, BACKOFF_MIN * 2 ** attempt) + random.random())
+        
+        return status, None
+    
+    def _process_page(self, page, status, parsed):
+        """Add one parsed page to self.jobs; returns False to stop paging"""
+        if status != 200:
+            print(f"❌ Failed to fetch page {page}: Status {status}")
+            return False
+        
+        num_cards, jobs = parsed
+        if not num_cards:
+            print(f"⚠️ No jobs found on page {page}")
+            return False
+        
+        # Skip listings already collected (result pages often overlap)
+        for job in jobs:
+            key = (job['job_title'], job['company'], job['location'], job['source'])
+            if key not in self._seen:
+                self._seen.add(key)
+                self.jobs.append(job)
+        
+        print(f"✅ Scraped page {page}: Found {num_cards} jobs")
+        return True
+    
     def clean_text(self, text):
         """Clean and normalize text"""
-        if not text:
-            return ""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return clean_text(text)
     
     def save_to_csv(self, filename=None):
         """Save scraped jobs to CSV"""
@@ -59,8 +479,7 @@ class JobScraper:
             filename = f'scraped_jobs_{timestamp}.csv'
         
         filepath = os.path.join(self.output_dir, filename)
-        df = pd.DataFrame(self.jobs)
-        df.to_csv(filepath, index=False, encoding='utf-8')
+        _write_jobs_csv(filepath, self.jobs)
         print(f"✅ Saved {len(self.jobs)} jobs to {filepath}")
         return filepath
     
@@ -86,15 +505,11 @@ class JobScraper:
             print("⚠️ No jobs to save!")
             return
         
-        conn = sqlite3.connect(db_path)
-        df = pd.DataFrame(self.jobs)
+        # JobDatabase creates the table if needed and skips jobs already stored
+        with JobDatabase(db_path) as db:
+            inserted = db.insert_job_records(self.jobs)
         
-        # Create table if it doesn't exist
-        df.to_sql('job_postings', conn, if_exists='append', index=False)
-        conn.commit()
-        conn.close()
-        
-        print(f"✅ Saved {len(self.jobs)} jobs to database: {db_path}")
+        print(f"✅ Saved {inserted} jobs to database: {db_path}")
         return db_path
 
 
@@ -108,8 +523,11 @@ class IndeedScraper(JobScraper):
     - This is for educational purposes only
     """
     
-    def __init__(self, country='sa', output_dir='data/raw'):
-        super().__init__(output_dir)
+    page_parser = staticmethod(parse_indeed_page)
+    page_size = 10
+    
+    def __init__(self, country='sa', output_dir='data/raw', cache=False):
+        super().__init__(output_dir, cache)
         self.base_url = f'https://{country}.indeed.com'
     
     def scrape_jobs(self, query='data scientist', location='riyadh', max_pages=3):
@@ -124,68 +542,11 @@ class IndeedScraper(JobScraper):
         print(f"🔍 Scraping Indeed for '{query}' in '{location}'...")
         print("⚠️ Note: This is a simplified example. Indeed has anti-bot protection.")
         
-        for page in range(max_pages):
-            start = page * 10
-            url = f"{self.base_url}/jobs?q={query}&l={location}&start={start}"
-            
-            try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Find job cards (Note: HTML structure may change)
-                    job_cards = soup.find_all('div', class_='job_seen_beacon')
-                    
-                    if not job_cards:
-                        print(f"⚠️ No jobs found on page {page + 1}")
-                        break
-                    
-                    for card in job_cards:
-                        job_data = self._parse_job_card(card)
-                        if job_data:
-                            self.jobs.append(job_data)
-                    
-                    print(f"✅ Scraped page {page + 1}: Found {len(job_cards)} jobs")
-                    self.add_delay()
-                else:
-                    print(f"❌ Failed to fetch page {page + 1}: Status {response.status_code}")
-                    break
-                    
-            except Exception as e:
-                print(f"❌ Error on page {page + 1}: {str(e)}")
-                break
-        
-        print(f"\n✅ Total jobs scraped: {len(self.jobs)}")
-        return self.jobs
+        return self._scrape(query, location, max_pages)
     
-    def _parse_job_card(self, card):
-        """Parse individual job card"""
-        try:
-            # Extract job details (structure may vary)
-            title_elem = card.find('h2', class_='jobTitle')
-            company_elem = card.find('span', class_='companyName')
-            location_elem = card.find('div', class_='companyLocation')
-            description_elem = card.find('div', class_='job-snippet')
-            
-            job_data = {
-                'job_title': self.clean_text(title_elem.text) if title_elem else '',
-                'company': self.clean_text(company_elem.text) if company_elem else '',
-                'location': self.clean_text(location_elem.text) if location_elem else '',
-                'description': self.clean_text(description_elem.text) if description_elem else '',
-                'salary': '',  # Indeed often doesn't show salary
-                'experience_level': '',
-                'posted_date': datetime.now().strftime('%Y-%m-%d'),
-                'source': 'Indeed',
-                'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            return job_data
-            
-        except Exception as e:
-            print(f"⚠️ Error parsing job card: {str(e)}")
-            return None
-
+    def _page_url(self, query, location, page):
+        start = (page - 1) * self.page_size
+        return f"{self.base_url}/jobs?q={query}&l={location}&start={start}"
 
 class LinkedInScraper(JobScraper):
     """
@@ -217,8 +578,10 @@ class BaytScraper(JobScraper):
     Better for Saudi Arabia job market
     """
     
-    def __init__(self, output_dir='data/raw'):
-        super().__init__(output_dir)
+    page_parser = staticmethod(parse_bayt_page)
+    
+    def __init__(self, output_dir='data/raw', cache=False):
+        super().__init__(output_dir, cache)
         self.base_url = 'https://www.bayt.com'
     
     def scrape_jobs(self, query='data scientist', location='saudi-arabia', max_pages=5):
@@ -232,74 +595,10 @@ class BaytScraper(JobScraper):
         """
         print(f"🔍 Scraping Bayt.com for '{query}' in '{location}'...")
         
-        for page in range(1, max_pages + 1):
-            url = f"{self.base_url}/en/saudi-arabia/jobs/{query.replace(' ', '-')}-jobs/?page={page}"
-            
-            try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Find job listings (structure may vary)
-                    job_cards = soup.find_all('li', class_='has-pointer-d')
-                    
-                    if not job_cards:
-                        print(f"⚠️ No jobs found on page {page}")
-                        break
-                    
-                    for card in job_cards:
-                        job_data = self._parse_job_card(card)
-                        if job_data:
-                            self.jobs.append(job_data)
-                    
-                    print(f"✅ Scraped page {page}: Found {len(job_cards)} jobs")
-                    self.add_delay()
-                else:
-                    print(f"❌ Failed to fetch page {page}: Status {response.status_code}")
-                    break
-                    
-            except Exception as e:
-                print(f"❌ Error on page {page}: {str(e)}")
-                break
-        
-        print(f"\n✅ Total jobs scraped: {len(self.jobs)}")
-        return self.jobs
+        return self._scrape(query, location, max_pages)
     
-    def _parse_job_card(self, card):
-        """Parse individual job card from Bayt"""
-        try:
-            job_data = {
-                'job_title': '',
-                'company': '',
-                'location': '',
-                'description': '',
-                'salary': '',
-                'experience_level': '',
-                'posted_date': datetime.now().strftime('%Y-%m-%d'),
-                'source': 'Bayt',
-                'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # Extract details (HTML structure may change)
-            title_elem = card.find('h2')
-            if title_elem:
-                job_data['job_title'] = self.clean_text(title_elem.text)
-            
-            company_elem = card.find('b', class_='t-default')
-            if company_elem:
-                job_data['company'] = self.clean_text(company_elem.text)
-            
-            location_elem = card.find('span', class_='t-mute')
-            if location_elem:
-                job_data['location'] = self.clean_text(location_elem.text)
-            
-            return job_data
-            
-        except Exception as e:
-            print(f"⚠️ Error parsing job card: {str(e)}")
-            return None
-
+    def _page_url(self, query, location, page):
+        return f"{self.base_url}/en/saudi-arabia/jobs/{query.replace(' ', '-')}-jobs/?page={page}"
 
 def create_sample_scraped_data(output_path='data/raw/sample_scraped_jobs.csv'):
     """
@@ -308,8 +607,6 @@ def create_sample_scraped_data(output_path='data/raw/sample_scraped_jobs.csv'):
     """
     print("🔄 Creating sample scraped job data...")
     
-    jobs = []
-    
     # Sample Saudi Arabian companies and job types
     companies = ['Saudi Aramco', 'SDAIA', 'STC', 'Thmanyah', 'Nana', 'Jahez', 
                  'Tamatem', 'Rewaa', 'Hungerstation', 'Noon']
@@ -335,23 +632,29 @@ def create_sample_scraped_data(output_path='data/raw/sample_scraped_jobs.csv'):
     
     experience_levels = ['Entry Level', 'Mid Level', 'Senior Level', 'Lead']
     
-    for i in range(500):  # Generate 500 sample jobs
-        job = {
-            'job_title': random.choice(job_titles),
-            'company': random.choice(companies),
-            'location': f"{random.choice(cities)}, Saudi Arabia",
-            'description': random.choice(descriptions),
-            'salary': random.choice(['', '15000-25000 SAR', '20000-35000 SAR', '30000-50000 SAR']),
-            'experience_level': random.choice(experience_levels),
-            'posted_date': f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-            'source': random.choice(['Indeed', 'Bayt', 'LinkedIn']),
-            'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        jobs.append(job)
+    salaries = ['', '15000-25000 SAR', '20000-35000 SAR', '30000-50000 SAR']
+    
+    # Every possible posted_date (months 1-12, days 1-28) formatted once up front
+    date_table = np.asarray([f'2024-{m:02d}-{d:02d}' for m in range(1, 13) for d in range(1, 29)])
+    
+    # Generate 500 sample jobs, one vectorized draw per column
+    num_jobs = 500
+    rng = np.random.default_rng()
+    
+    df = pd.DataFrame({
+        'job_title': rng.choice(np.asarray(job_titles), num_jobs),
+        'company': rng.choice(np.asarray(companies), num_jobs),
+        'location': np.char.add(rng.choice(np.asarray(cities), num_jobs), ', Saudi Arabia'),
+        'description': rng.choice(np.asarray(descriptions), num_jobs),
+        'salary': rng.choice(np.asarray(salaries), num_jobs),
+        'experience_level': rng.choice(np.asarray(experience_levels), num_jobs),
+        'posted_date': rng.choice(date_table, num_jobs),
+        'source': rng.choice(np.asarray(['Indeed', 'Bayt', 'LinkedIn']), num_jobs),
+        'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    })
     
-    df = pd.DataFrame(jobs)
     df.to_csv(output_path, index=False)
-    print(f"✅ Created {len(jobs)} sample jobs at: {output_path}")
+    print(f"✅ Created {len(df)} sample jobs at: {output_path}")
     return output_path
 
 
@@ -376,36 +679,53 @@ def scrape_bayt_jobs():
 
 def scrape_multiple_sources():
     """Example: Scrape from multiple sources and combine"""
-    all_jobs = []
-    
-    # Scrape Indeed
-    print("\n" + "="*80)
-    print("SCRAPING INDEED")
-    print("="*80)
-    indeed_scraper = IndeedScraper(country='sa')
-    indeed_jobs = indeed_scraper.scrape_jobs('software engineer', 'riyadh', max_pages=2)
-    all_jobs.extend(indeed_jobs)
-    
-    # Scrape Bayt
-    print("\n" + "="*80)
-    print("SCRAPING BAYT")
-    print("="*80)
-    bayt_scraper = BaytScraper()
-    bayt_jobs = bayt_scraper.scrape_jobs('data scientist', 'saudi-arabia', max_pages=2)
-    all_jobs.extend(bayt_jobs)
+    if _can_run_async():
+        # Sources are on different hosts, so scrape them at the same time
+        print("\n" + "="*80)
+        print("SCRAPING INDEED AND BAYT")
+        print("="*80)
+        all_jobs = asyncio.run(scrape_multiple_sources_async())
+    else:
+        all_jobs = []
+        
+        # Scrape Indeed
+        print("\n" + "="*80)
+        print("SCRAPING INDEED")
+        print("="*80)
+        indeed_scraper = IndeedScraper(country='sa')
+        indeed_jobs = indeed_scraper.scrape_jobs('software engineer', 'riyadh', max_pages=2)
+        all_jobs.extend(indeed_jobs)
+        
+        # Scrape Bayt
+        print("\n" + "="*80)
+        print("SCRAPING BAYT")
+        print("="*80)
+        bayt_scraper = BaytScraper()
+        bayt_jobs = bayt_scraper.scrape_jobs('data scientist', 'saudi-arabia', max_pages=2)
+        all_jobs.extend(bayt_jobs)
     
     # Save combined results
     if all_jobs:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        df = pd.DataFrame(all_jobs)
         filepath = f'data/raw/combined_jobs_{timestamp}.csv'
-        df.to_csv(filepath, index=False)
+        _write_jobs_csv(filepath, all_jobs)
         print(f"\n✅ Total jobs collected: {len(all_jobs)}")
         print(f"✅ Saved to: {filepath}")
     
     return all_jobs
 
 
+async def scrape_multiple_sources_async():
+    """Scrape Indeed and Bayt concurrently, each with its own aiohttp session"""
+    indeed_scraper = IndeedScraper(country='sa')
+    bayt_scraper = BaytScraper()
+    
+    indeed_jobs, bayt_jobs = await asyncio.gather(
+        indeed_scraper.scrape_jobs_async('software engineer', 'riyadh', max_pages=2),
+        bayt_scraper.scrape_jobs_async('data scientist', 'saudi-arabia', max_pages=2)
+    )
+    return indeed_jobs + bayt_jobs
+
 if __name__ == '__main__':
     print("="*80)
     print("JOB MARKET DATA SCRAPER")
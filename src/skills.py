@@ -0,0 +1,65 @@
+"""
+Skill Bitmasks for Job Postings
+Encodes the canonical skills found in a job description as one 64-bit integer
+"""
+
+import re
+
+
+# Canonical skills, named as in the notebook's SKILLS_DICT. The position of a
+# skill is its bit in skills_mask and is stored in the database, so only ever
+# append to this list (SQLite integers are signed 64-bit: at most 63 skills).
+SKILLS = [
+    # Programming languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'scala',
+    'kotlin', 'golang', 'rust', 'php', 'matlab',
+    # Data science & ML
+    'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'keras',
+    'scikit-learn', 'pandas', 'numpy', 'nlp', 'computer vision', 'mlops',
+    # Databases
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'kubernetes', 'docker', 'microservices', 'terraform',
+    'ci/cd', 'devops', 'git',
+    # Web development
+    'react', 'angular', 'node.js', 'django', 'flask', 'spring boot', 'rest api',
+    'graphql',
+    # Big data
+    'spark', 'hadoop', 'kafka', 'airflow', 'etl', 'data pipeline', 'snowflake',
+    # BI & visualization
+    'tableau', 'power bi', 'excel', 'data visualization', 'statistical analysis',
+    'data analysis',
+    # Practices
+    'agile', 'scrum', 'problem solving'
+]
+
+assert len(SKILLS) <= 63, 'skills_mask holds at most 63 skills'
+
+# Skill name -> bit position
+SKILL_BITS = {skill: bit for bit, skill in enumerate(SKILLS)}
+
+# One pass over the text finds every skill; longest names first so that
+# e.g. 'spring boot' wins over shorter overlapping names. A trailing 's' is
+# allowed so plurals such as "REST APIs" still match.
+_SKILL_RE = re.compile(
+    r'(?<![\w+#.])('
+    + '|'.join(re.escape(skill) for skill in sorted(SKILLS, key=len, reverse=True))
+    + r')s?(?![\w+#])',
+    re.IGNORECASE
+)
+
+
+def skills_mask(text):
+    """Return the bitmask of canonical skills mentioned in text"""
+    if not isinstance(text, str):
+        return 0
+
+    mask = 0
+    for match in _SKILL_RE.findall(text):
+        mask |= 1 << SKILL_BITS[match.lower()]
+    return mask
+
+
+def skills_from_mask(mask):
+    """Return the list of skill names encoded in mask"""
+    return [skill for bit, skill in enumerate(SKILLS) if mask >> bit & 1]
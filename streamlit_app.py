@@ -5,13 +5,12 @@ Interactive Streamlit Dashboard for Job Market Insights
 To run: streamlit run streamlit_app.py
 """
 
+import io
+import os
+import re
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-from collections import Counter
+import numpy as np
 
 # Page configuration
 st.set_page_config(
@@ -44,49 +43,485 @@ st.markdown('<h1 class="main-header">📊 Job Market Analysis Dashboard</h1>', u
 st.markdown("---")
 
 # Load data
+DATA_PATH = 'data/processed/job_market_clean.csv'
+PARQUET_PATH = 'data/processed/job_market_clean.parquet'
+
+# Precomputed skill counts per filter combination (see prepare_dashboard_data.py)
+SKILLS_INDEX_PATH = 'data/processed/skills_index.parquet'
+
+# Repetitive columns stored as categoricals (sorted categories, int codes):
+# value_counts/nunique work on the codes and filter options come from the categories
+CATEGORY_COLUMNS = ['experience_level', 'location', 'company', 'source', 'job_title', 'job_title_clean']
+
+# One quoted item of a skills list as written by the notebook (skill names
+# come from its SKILLS_DICT and contain no quotes or commas); used without pyarrow
+SKILL_ITEM_RE = r"'([^']*)'"
+
+
+def is_parquet_current(path=PARQUET_PATH):
+    """True if the Parquet file exists and is not older than the CSV"""
+    if not os.path.exists(path):
+        return False
+    return not os.path.exists(DATA_PATH) or os.path.getmtime(path) >= os.path.getmtime(DATA_PATH)
+
+
+def downcast_columns(df):
+    """Shrink numeric columns to their smallest dtype and store text as Arrow strings (in place)"""
+    for col in df.select_dtypes('integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes('float').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    
+    # skills is parsed into lists separately
+    text_columns = [col for col in df.select_dtypes(['object', 'string']).columns if col != 'skills']
+    try:
+        df[text_columns] = df[text_columns].astype('string[pyarrow]')
+    except ImportError:
+        pass
+
+
+def parse_skill_lists(skills):
+    """Parse "['python', 'sql']" strings into arrays of skill names, NaN stays NaN"""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return skills.str.findall(SKILL_ITEM_RE)
+    
+    # Arrow kernels: trim the brackets, drop the quotes, split on the separators
+    items = pc.replace_substring(pc.utf8_trim(pa.array(skills, type=pa.string()), '[]'), "'", '')
+    lists = pc.if_else(pc.equal(items, ''), pa.scalar([], pa.list_(pa.string())), pc.split_pattern(items, ', '))
+    return pd.Series(lists.to_pandas(), index=skills.index, name=skills.name)
+
+
+def data_version():
+    """Modification time of the dataset, used to key the cached data on it"""
+    for path in (DATA_PATH, PARQUET_PATH):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            pass
+    return None
+
+
+@st.cache_data
+def load_data(version, columns=None):
+    """Load the processed dataset (only `columns`, if given), preferring its Parquet copy
+    
+    `version` (see data_version) only keys the cache, so a regenerated
+    dataset is picked up without restarting the app.
+    """
+    if not is_parquet_current():
+        try:
+            df = pd.read_csv(DATA_PATH)
+        except FileNotFoundError:
+            st.error("⚠️ Dataset not found! Please run the Jupyter notebook first to generate processed data.")
+            st.info(f"Path: {DATA_PATH}")
+            return None
+        
+        for col in CATEGORY_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        memory_before = df.memory_usage(deep=True).sum()
+        downcast_columns(df)
+        print(f"✅ Dataset memory: {memory_before / 1e6:.1f} MB -> {df.memory_usage(deep=True).sum() / 1e6:.1f} MB")
+        
+        # Parse the "['python', 'sql']" skills strings into lists once; the
+        # Parquet copy then stores them as a list<string> column
+        if 'skills' in df.columns:
+            df['skills'] = parse_skill_lists(df['skills'])
+        
+        # Write a Parquet copy so later loads skip CSV parsing
+        try:
+            df.to_parquet(PARQUET_PATH, engine='pyarrow', compression='zstd', index=False)
+        except (ImportError, OSError) as e:
+            print(f"⚠️ Could not write {PARQUET_PATH}: {e}")
+            return df if columns is None else df[[col for col in columns if col in df.columns]]
+    
+    # Parquet is columnar: only the requested columns are read and decoded
+    if columns is not None:
+        import pyarrow.parquet as pq
+        available = pq.read_schema(PARQUET_PATH).names
+        columns = [col for col in columns if col in available]
+    return pd.read_parquet(PARQUET_PATH, columns=columns, engine='pyarrow')
+
+
+# Columns the dashboard's filters, charts and job listings use
+DASHBOARD_COLUMNS = ('job_title', 'job_title_clean', 'company', 'location',
+                     'experience_level', 'salary', 'description', 'skills')
+
+
+def load_dashboard_data(version):
+    """The dataset projected to DASHBOARD_COLUMNS"""
+    return load_data(version, DASHBOARD_COLUMNS)
+
+
 @st.cache_data
-def load_data():
-    """Load the processed dataset"""
+def dashboard_memory_mb(version):
+    """Memory held by the dashboard's columns, in MB"""
+    return load_dashboard_data(version).memory_usage(deep=True).sum() / 1e6
+
+
+# Words drawn in the word cloud (WordCloud's own max_words default) and its layout size
+WORDCLOUD_MAX_WORDS = 200
+WORDCLOUD_WIDTH, WORDCLOUD_HEIGHT = 1600, 400
+
+# Opening <svg ...> tag of WordCloud.to_svg output
+SVG_ROOT_RE = re.compile(r'<svg\b[^>]*>')
+
+
+@st.cache_data(max_entries=32)
+def make_wordcloud(frequencies):
+    """Word cloud SVG markup for a tuple of (skill, count) pairs"""
+    # Imported on demand: wordcloud pulls in PIL and is only needed here
+    from wordcloud import WordCloud
+    
+    wordcloud = WordCloud(
+        width=WORDCLOUD_WIDTH,
+        height=WORDCLOUD_HEIGHT,
+        background_color='white',
+        colormap='viridis',
+        max_words=WORDCLOUD_MAX_WORDS
+    ).generate_from_frequencies(dict(frequencies))
+    
+    # Vector text instead of a rasterized 1600x400 image. The layout was
+    # measured with WordCloud's font, so that font is embedded (subset to the
+    # glyphs used, via fontTools, which matplotlib already requires).
+    svg = wordcloud.to_svg(embed_font=True, optimize_embedded_font=True)
+    
+    # Replace the fixed-size root tag with a viewBox the browser scales to the column
+    root = (f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="0 0 {WORDCLOUD_WIDTH} {WORDCLOUD_HEIGHT}" width="100%">')
+    return SVG_ROOT_RE.sub(root, svg, count=1)
+
+
+def category_counts(series, mask):
+    """Row count of every category of a categorical column over the masked rows"""
+    codes = series.cat.codes.to_numpy()[mask]
+    return np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+
+
+def present_categories(series, mask):
+    """Sorted categories of a categorical column that occur in the masked rows"""
+    return series.cat.categories[category_counts(series, mask) > 0].tolist()
+
+
+def value_counts(series):
+    """value_counts without the zero counts of unused categories"""
+    counts = series.value_counts()
+    return counts[counts > 0]
+
+
+def top_counts(series, mask, n=None):
+    """Counts of the values in the masked rows, most common first (only the top n if given)"""
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        counts = value_counts(series[mask])
+        return counts if n is None else counts.head(n)
+    
+    # Histogram the category codes, then partially sort: only n entries get ordered
+    counts = category_counts(series, mask)
+    top = np.flatnonzero(counts)
+    if n is not None and len(top) > n:
+        top = top[np.argpartition(-counts[top], n - 1)[:n]]
+    top = top[np.argsort(-counts[top], kind='stable')]
+    return pd.Series(counts[top], index=pd.Index(series.cat.categories[top], name=series.name), name='count')
+
+
+@st.cache_data
+def filter_mask(version, location, job, exp):
+    """Boolean row mask for one combination of sidebar filters ("All" = any)"""
+    data = load_dashboard_data(version)
+    
+    # Combine the filters as NumPy masks to skip index alignment
+    mask = np.ones(len(data), dtype=bool)
+    for col, value in (('location', location), ('job_title_clean', job), ('experience_level', exp)):
+        if value != "All":
+            mask &= (data[col] == value).to_numpy()
+    return mask
+
+
+@st.cache_data
+def filter_options(version, column, location="All", job="All"):
+    """Sorted values of a filter column among rows matching the filters above it"""
+    data = load_dashboard_data(version)
+    return present_categories(data[column], filter_mask(version, location, job, "All"))
+
+
+def share_table(counts, total, label, count_label, share_label):
+    """Table of counts and their share of total as "12.3%" strings"""
+    shares = (counts.to_numpy() / total * 100).round(1).astype(str)
+    return pd.DataFrame({
+        label: counts.index,
+        count_label: counts.to_numpy(),
+        share_label: np.char.add(shares, '%')
+    })
+
+
+@st.cache_data
+def compute_views(version, location, job, exp):
+    """Row mask and chart tables for one combination of sidebar filters"""
+    data = load_dashboard_data(version)
+    mask = filter_mask(version, location, job, exp)
+    
+    title_col = 'job_title_clean' if 'job_title_clean' in data.columns else 'job_title'
+    
+    views = {'mask': mask, 'n': int(mask.sum())}
+    if title_col in data.columns:
+        views['top_jobs'] = top_counts(data[title_col], mask, 10)
+    if 'location' in data.columns:
+        views['top_locations'] = top_counts(data['location'], mask, 10)
+    if 'company' in data.columns:
+        views['top_companies'] = top_counts(data['company'], mask, 10)
+        views['company_table'] = share_table(views['top_companies'], views['n'], 'Company', 'Jobs', 'Share')
+    if 'experience_level' in data.columns:
+        views['exp_dist'] = top_counts(data['experience_level'], mask)
+        views['exp_table'] = share_table(views['exp_dist'], views['n'], 'Experience Level', 'Count', 'Percentage')
+    return views
+
+
+@st.cache_data
+def skill_codes(version):
+    """Skills of every row as int codes: (names, flat codes, per-row counts)
+    
+    Row i's skills are codes[offsets[i]:offsets[i + 1]] with offsets the
+    cumulative sum of lengths, so any row mask can be counted without
+    touching Python strings again.
+    """
+    skills = load_dashboard_data(version)['skills']
+    lengths = skills.map(len, na_action='ignore').fillna(0).to_numpy(dtype=np.int64)
+    codes, names = pd.factorize(skills.dropna().explode().dropna())
+    return names.tolist(), codes.astype(np.int32), lengths
+
+
+@st.cache_resource
+def masked_skill_counter():
+    """Numba-compiled counter of the skill codes in masked rows, or None without numba"""
     try:
-        df = pd.read_csv('data/processed/job_market_clean.csv')
-        return df
-    except FileNotFoundError:
-        st.error("⚠️ Dataset not found! Please run the Jupyter notebook first to generate processed data.")
-        st.info("Path: data/processed/job_market_clean.csv")
+        from numba import njit
+    except ImportError:
         return None
+    
+    # Compiled once per process: cache_resource keeps the dispatcher across reruns
+    @njit(nogil=True)
+    def count(codes, lengths, mask, num_skills):
+        counts = np.zeros(num_skills, dtype=np.int64)
+        start = 0
+        for row in range(lengths.shape[0]):
+            end = start + lengths[row]
+            if mask[row]:
+                for i in range(start, end):
+                    counts[codes[i]] += 1
+            start = end
+        return counts
+    
+    return count
+
+
+@st.cache_data
+def load_skills_index(version):
+    """The precomputed skills index, or None if it is missing or older than the CSV"""
+    if not is_parquet_current(SKILLS_INDEX_PATH):
+        return None
+    try:
+        return pd.read_parquet(SKILLS_INDEX_PATH, engine='pyarrow')
+    except (ImportError, OSError) as e:
+        print(f"⚠️ Could not read {SKILLS_INDEX_PATH}: {e}")
+        return None
+
+
+def indexed_skill_counts(version, location, job, exp):
+    """Skill frequencies summed from the skills index, or None if it can't answer the filters"""
+    index = load_skills_index(version)
+    if index is None:
+        return None
+    
+    mask = np.ones(len(index), dtype=bool)
+    for col, value in (('location', location), ('job_title_clean', job), ('experience_level', exp)):
+        if value != "All":
+            if col not in index.columns:
+                return None
+            mask &= (index[col] == value).to_numpy()
+    
+    counts = index[mask].groupby('skill', observed=True)['count'].sum()
+    return counts[counts > 0].rename_axis('skills').sort_values(ascending=False, kind='stable')
 
-df = load_data()
+
+@st.cache_data
+def compute_skills(version, location, job, exp):
+    """Skill frequencies (most common first) for one combination of sidebar filters"""
+    # A few thousand precomputed rows answer this without touching the postings
+    skill_counts = indexed_skill_counts(version, location, job, exp)
+    if skill_counts is not None:
+        return skill_counts
+    
+    names, codes, lengths = skill_codes(version)
+    mask = filter_mask(version, location, job, exp)
+    
+    # One native loop over the codes; NumPy (repeat + bincount) without numba
+    count = masked_skill_counter()
+    if count is not None:
+        counts = count(codes, lengths, mask, len(names))
+    else:
+        counts = np.bincount(codes[np.repeat(mask, lengths)], minlength=len(names))
+    
+    skill_counts = pd.Series(counts, index=pd.Index(names, name='skills'), name='count')
+    return skill_counts[skill_counts > 0].sort_values(ascending=False, kind='stable')
+
+
+@st.cache_data
+def filtered_csv(version, location, job, exp):
+    """CSV bytes of the filtered rows, with skills lists written back as "['a', 'b']" strings"""
+    data = load_data(version)[filter_mask(version, location, job, exp)]
+    if 'skills' in data.columns:
+        data = data.assign(skills=data['skills'].map(lambda v: str(list(v)), na_action='ignore'))
+    
+    # pyarrow's multithreaded CSV writer is several times faster than to_csv
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return data.to_csv(index=False).encode('utf-8')
+    
+    buffer = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(data, preserve_index=False), buffer)
+    return buffer.getvalue()
+
+
+# Columns shown on a job card
+CARD_COLUMNS = ['job_title', 'company', 'location', 'experience_level', 'salary', 'description']
+
+
+@st.cache_data
+def job_cards(version, location, job, exp, num_jobs):
+    """First num_jobs filtered postings as plain dicts for the cards view"""
+    data = load_dashboard_data(version)
+    positions = np.flatnonzero(filter_mask(version, location, job, exp))[:num_jobs]
+    columns = [col for col in CARD_COLUMNS if col in data.columns]
+    return data.iloc[positions][columns].to_dict('records')
+
+
+# Top-10 bar charts: view name -> (axis label, bar label, color scale)
+BAR_CHARTS = {
+    'top_jobs': ('Job Title', 'Number of Jobs', 'Blues'),
+    'top_locations': ('Location', 'Number of Jobs', 'Greens'),
+    'top_companies': ('Company', 'Number of Job Postings', 'Purples'),
+}
+
+# Figures are cached per filter combination, so reruns with unchanged filters
+# skip building them; plotly is imported on first use so the metrics render first
+
+
+@st.cache_data(max_entries=64)
+def bar_figure(version, location, job, exp, view):
+    """Horizontal bar chart of one of the BAR_CHARTS views"""
+    import plotly.express as px
+    
+    counts = compute_views(version, location, job, exp)[view]
+    label, count_label, colorscale = BAR_CHARTS[view]
+    fig = px.bar(
+        x=counts.values,
+        y=counts.index,
+        orientation='h',
+        labels={'x': count_label, 'y': label},
+        color=counts.values,
+        color_continuous_scale=colorscale
+    )
+    fig.update_layout(showlegend=False, height=400)
+    return fig
+
+
+@st.cache_data(max_entries=64)
+def experience_figure(version, location, job, exp):
+    """Pie chart of the experience level distribution"""
+    import plotly.express as px
+    
+    exp_dist = compute_views(version, location, job, exp)['exp_dist']
+    fig = px.pie(
+        values=exp_dist.values,
+        names=exp_dist.index,
+        title="",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+
+@st.cache_data(max_entries=64)
+def skills_figures(version, location, job, exp):
+    """Bar chart and treemap of the top 20 skills"""
+    import plotly.express as px
+    
+    top_skills = compute_skills(version, location, job, exp).head(20).rename_axis('Skill').reset_index(name='Count')
+    
+    bar = px.bar(
+        top_skills,
+        x='Count',
+        y='Skill',
+        orientation='h',
+        title="Top 20 Skills",
+        color='Count',
+        color_continuous_scale='Viridis'
+    )
+    bar.update_layout(showlegend=False, height=600)
+    
+    treemap = px.treemap(
+        top_skills,
+        path=['Skill'],
+        values='Count',
+        color='Count',
+        color_continuous_scale='Viridis'
+    )
+    treemap.update_layout(height=400, margin=dict(t=0, l=0, r=0, b=0))
+    return bar, treemap
+
+
+def session_cached(name, func, *args):
+    """func(*args), kept in st.session_state and reused while args are unchanged
+    
+    Reruns that leave the filters alone (toggles, slider, view mode) then skip
+    even st.cache_data's argument hashing and copying of the cached result.
+    """
+    entry = st.session_state.get(name)
+    if entry is None or entry[0] != args:
+        entry = (args, func(*args))
+        st.session_state[name] = entry
+    return entry[1]
+
+
+version = data_version()
+df = load_dashboard_data(version)
 
 if df is not None:
     # Sidebar filters
     st.sidebar.header("🔍 Filters")
     
+    # Each filter narrows the options of the next (option lists are cached)
+    
     # Location filter
+    selected_location = "All"
     if 'location' in df.columns:
-        all_locations = ["All"] + sorted(df['location'].unique().tolist())
+        all_locations = ["All"] + filter_options(version, 'location')
         selected_location = st.sidebar.selectbox("Select Location", all_locations)
-        
-        if selected_location != "All":
-            df = df[df['location'] == selected_location]
     
     # Job title filter
+    selected_job = "All"
     if 'job_title_clean' in df.columns:
-        all_jobs = ["All"] + sorted(df['job_title_clean'].unique().tolist())
+        all_jobs = ["All"] + filter_options(version, 'job_title_clean', selected_location)
         selected_job = st.sidebar.selectbox("Select Job Title", all_jobs)
-        
-        if selected_job != "All":
-            df = df[df['job_title_clean'] == selected_job]
     
     # Experience level filter
+    selected_exp = "All"
     if 'experience_level' in df.columns:
-        all_exp = ["All"] + sorted(df['experience_level'].unique().tolist())
+        all_exp = ["All"] + filter_options(version, 'experience_level', selected_location, selected_job)
         selected_exp = st.sidebar.selectbox("Select Experience Level", all_exp)
-        
-        if selected_exp != "All":
-            df = df[df['experience_level'] == selected_exp]
+    
+    views = session_cached('views', compute_views, version, selected_location, selected_job, selected_exp)
+    df = df[views['mask']]
     
     st.sidebar.markdown("---")
-    st.sidebar.info(f"📊 Showing {len(df):,} job postings")
+    st.sidebar.info(f"📊 Showing {views['n']:,} job postings")
+    st.sidebar.caption(f"💾 Dataset in memory: {dashboard_memory_mb(version):.1f} MB")
     
     # Key Metrics
     st.header("📈 Key Metrics")
@@ -119,19 +554,10 @@ if df is not None:
         title_col = 'job_title_clean' if 'job_title_clean' in df.columns else 'job_title'
         
         if title_col in df.columns:
-            top_jobs = df[title_col].value_counts().head(10)
+            top_jobs = views['top_jobs']
             
             if len(top_jobs) > 0:
-                fig = px.bar(
-                    x=top_jobs.values,
-                    y=top_jobs.index,
-                    orientation='h',
-                    labels={'x': 'Number of Jobs', 'y': 'Job Title'},
-                    color=top_jobs.values,
-                    color_continuous_scale='Blues'
-                )
-                fig.update_layout(showlegend=False, height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(bar_figure(version, selected_location, selected_job, selected_exp, 'top_jobs'), use_container_width=True)
             else:
                 st.info("No job title data available")
         else:
@@ -141,19 +567,10 @@ if df is not None:
         # Top Locations
         st.subheader("🌍 Top 10 Locations")
         if 'location' in df.columns:
-            top_locations = df['location'].value_counts().head(10)
+            top_locations = views['top_locations']
             
             if len(top_locations) > 0:
-                fig = px.bar(
-                    x=top_locations.values,
-                    y=top_locations.index,
-                    orientation='h',
-                    labels={'x': 'Number of Jobs', 'y': 'Location'},
-                    color=top_locations.values,
-                    color_continuous_scale='Greens'
-                )
-                fig.update_layout(showlegend=False, height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(bar_figure(version, selected_location, selected_job, selected_exp, 'top_locations'), use_container_width=True)
             else:
                 st.info("No location data available")
         else:
@@ -164,30 +581,16 @@ if df is not None:
     # Experience Level Distribution
     st.subheader("📊 Experience Level Distribution")
     if 'experience_level' in df.columns:
-        exp_dist = df['experience_level'].value_counts()
+        exp_dist = views['exp_dist']
         
         if len(exp_dist) > 0:
             col1, col2 = st.columns([1, 2])
             
             with col1:
-                st.dataframe(
-                    pd.DataFrame({
-                        'Experience Level': exp_dist.index,
-                        'Count': exp_dist.values,
-                        'Percentage': [f"{(v/len(df)*100):.1f}%" for v in exp_dist.values]
-                    }),
-                    hide_index=True
-                )
+                st.dataframe(views['exp_table'], hide_index=True)
             
             with col2:
-                fig = px.pie(
-                    values=exp_dist.values,
-                    names=exp_dist.index,
-                    title="",
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(experience_figure(version, selected_location, selected_job, selected_exp), use_container_width=True)
         else:
             st.info("No experience level data available")
     else:
@@ -198,33 +601,16 @@ if df is not None:
     # Top Companies
     st.subheader("🏢 Top Hiring Companies")
     if 'company' in df.columns:
-        top_companies = df['company'].value_counts().head(10)
+        top_companies = views['top_companies']
         
         if len(top_companies) > 0:
             col1, col2 = st.columns([2, 1])
             
             with col1:
-                fig = px.bar(
-                    x=top_companies.values,
-                    y=top_companies.index,
-                    orientation='h',
-                    labels={'x': 'Number of Job Postings', 'y': 'Company'},
-                    color=top_companies.values,
-                    color_continuous_scale='Purples'
-                )
-                fig.update_layout(showlegend=False, height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(bar_figure(version, selected_location, selected_job, selected_exp, 'top_companies'), use_container_width=True)
             
             with col2:
-                st.dataframe(
-                    pd.DataFrame({
-                        'Company': top_companies.index,
-                        'Jobs': top_companies.values,
-                        'Share': [f"{(v/len(df)*100):.1f}%" for v in top_companies.values]
-                    }),
-                    hide_index=True,
-                    height=400
-                )
+                st.dataframe(views['company_table'], hide_index=True, height=400)
         else:
             st.info("No company data available")
     else:
@@ -235,41 +621,20 @@ if df is not None:
     # Skills Analysis
     st.subheader("🔥 Most In-Demand Skills")
     
+    top_skills = None
     if 'skills' in df.columns:
-        # Extract all skills
         try:
-            import ast
-            all_skills = []
-            for skills_str in df['skills'].dropna():
-                try:
-                    if isinstance(skills_str, str):
-                        skills_list = ast.literal_eval(skills_str)
-                        if isinstance(skills_list, list):
-                            all_skills.extend(skills_list)
-                except:
-                    pass
+            skill_counts = session_cached('skill_counts', compute_skills, version, selected_location, selected_job, selected_exp)
             
-            if all_skills:
-                skill_counts = Counter(all_skills)
-                top_skills = pd.DataFrame(
-                    skill_counts.most_common(20),
-                    columns=['Skill', 'Count']
-                )
+            if len(skill_counts) > 0:
+                top_skills = skill_counts.head(20).rename_axis('Skill').reset_index(name='Count')
+                
+                bar, treemap = skills_figures(version, selected_location, selected_job, selected_exp)
                 
                 col1, col2 = st.columns([2, 1])
                 
                 with col1:
-                    fig = px.bar(
-                        top_skills,
-                        x='Count',
-                        y='Skill',
-                        orientation='h',
-                        title="Top 20 Skills",
-                        color='Count',
-                        color_continuous_scale='Viridis'
-                    )
-                    fig.update_layout(showlegend=False, height=600)
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(bar, use_container_width=True)
                 
                 with col2:
                     st.dataframe(
@@ -278,21 +643,13 @@ if df is not None:
                         height=600
                     )
                 
-                # Word Cloud
-                st.subheader("☁️ Skills Word Cloud")
-                skills_text = ' '.join(all_skills)
-                
-                wordcloud = WordCloud(
-                    width=1600,
-                    height=400,
-                    background_color='white',
-                    colormap='viridis'
-                ).generate(skills_text)
+                # Skills Treemap (reuses Plotly; the word cloud is opt-in)
+                st.subheader("☁️ Skills Map")
+                st.plotly_chart(treemap, use_container_width=True)
                 
-                fig, ax = plt.subplots(figsize=(16, 4))
-                ax.imshow(wordcloud, interpolation='bilinear')
-                ax.axis('off')
-                st.pyplot(fig)
+                if st.toggle("Show word cloud"):
+                    # WordCloud lays out at most 200 words; passing no more keeps the cache key small
+                    st.markdown(make_wordcloud(tuple(skill_counts.head(WORDCLOUD_MAX_WORDS).items())), unsafe_allow_html=True)
             else:
                 st.warning("No skills data available after filtering")
         except Exception as e:
@@ -313,7 +670,7 @@ if df is not None:
     
     if view_mode == "Cards":
         # Card view - more visual
-        for idx, row in df.head(num_jobs).iterrows():
+        for row in job_cards(version, selected_location, selected_job, selected_exp, num_jobs):
             with st.container():
                 col1, col2 = st.columns([3, 1])
                 
@@ -361,8 +718,12 @@ if df is not None:
     
     # Raw Data Explorer
     with st.expander("📋 View All Raw Data"):
-        st.dataframe(df.head(100), use_container_width=True)
-        st.info(f"Showing first 100 of {len(df):,} rows")
+        # The expander body runs even when collapsed, so the rows are opt-in
+        if st.toggle("Load first 100 rows"):
+            # The dashboard frame is projected; raw rows come from the full dataset
+            raw_rows = load_data(version).iloc[np.flatnonzero(views['mask'])[:100]]
+            st.dataframe(raw_rows, use_container_width=True)
+            st.info(f"Showing first {len(raw_rows):,} of {len(df):,} rows")
     
     # Download section
     st.markdown("---")
@@ -371,16 +732,24 @@ if df is not None:
     col1, col2 = st.columns(2)
     
     with col1:
-        csv = df.to_csv(index=False).encode('utf-8')
-        st.download_button(
-            label="📥 Download Filtered Data (CSV)",
-            data=csv,
-            file_name="filtered_job_data.csv",
-            mime="text/csv"
-        )
+        # Serializing the whole filtered set is only worth it when asked for.
+        # Once prepared, the download stays up across reruns (clicking it
+        # reruns the script) until the filters change.
+        filter_key = (version, selected_location, selected_job, selected_exp)
+        if st.button("Prepare Filtered Data (CSV)"):
+            st.session_state['csv_filters'] = filter_key
+        
+        if st.session_state.get('csv_filters') == filter_key:
+            csv = session_cached('filtered_csv', filtered_csv, *filter_key)
+            st.download_button(
+                label="📥 Download Filtered Data (CSV)",
+                data=csv,
+                file_name="filtered_job_data.csv",
+                mime="text/csv"
+            )
     
     with col2:
-        if 'skills' in df.columns and len(all_skills) > 0:
+        if top_skills is not None:
             skills_csv = top_skills.to_csv(index=False).encode('utf-8')
             st.download_button(
                 label="📥 Download Top Skills (CSV)",
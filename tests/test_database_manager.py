@@ -0,0 +1,224 @@
+"""Tests for src/database_manager.py"""
+
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from src import database_manager
+from src.database_manager import JobDatabase, load_csv_to_database, merge_csv_files, merge_multiple_sources
+from src.skills import skills_from_mask
+
+
+def make_jobs(count, **columns):
+    """DataFrame of count distinct jobs"""
+    jobs = pd.DataFrame({
+        'job_title': [f'Engineer {i}' for i in range(count)],
+        'company': 'Acme',
+        'location': 'Riyadh',
+        'description': 'Python and SQL'
+    })
+    return jobs.assign(**columns)
+
+
+def count_rows(db):
+    """Rows in job_postings"""
+    return db._conn.execute('SELECT COUNT(*) FROM job_postings').fetchone()[0]
+
+
+def test_load_csv_rolls_back_on_error(tmp_path, monkeypatch):
+    csv_path = tmp_path / 'jobs.csv'
+    make_jobs(30).to_csv(csv_path, index=False)
+    
+    # Fail on the third chunk
+    monkeypatch.setattr(database_manager, 'CSV_CHUNK_SIZE', 6)
+    read_chunks = database_manager._iter_csv_chunks
+    
+    def failing_chunks(path):
+        for i, chunk in enumerate(read_chunks(path)):
+            if i == 2:
+                raise pd.errors.ParserError('bad chunk')
+            yield chunk
+    
+    monkeypatch.setattr(database_manager, '_iter_csv_chunks', failing_chunks)
+    
+    with pytest.raises(pd.errors.ParserError):
+        load_csv_to_database(str(csv_path), str(tmp_path / 'jobs.db'))
+    
+    with JobDatabase(str(tmp_path / 'jobs.db')) as db:
+        assert count_rows(db) == 0
+        indexes = {row[0] for row in db._conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert set(database_manager.INDEXES) <= indexes
+
+
+def test_failed_insert_leaves_connection_usable(tmp_path, monkeypatch):
+    def failing_mask(text):
+        if text == 'bad':
+            raise ValueError('bad description')
+        return 0
+    
+    with JobDatabase(str(tmp_path / 'jobs.db')) as db:
+        # Fail each insert part way through its transaction
+        monkeypatch.setattr(database_manager, 'skills_mask', failing_mask)
+        bad = make_jobs(3, description=['ok', 'ok', 'bad'])
+        with pytest.raises(ValueError):
+            db.insert_jobs(bad)
+        with pytest.raises(ValueError):
+            db.insert_job_records(bad.to_dict('records'))
+        assert count_rows(db) == 0
+        
+        assert db.insert_jobs(make_jobs(2)) == 2
+        assert db.insert_job_records(make_jobs(3).to_dict('records')) == 1
+        assert count_rows(db) == 3
+
+
+def test_merge_keeps_every_column_and_skips_empty_files(tmp_path, capsys):
+    empty = tmp_path / 'empty.csv'
+    empty.write_text('')
+    first = tmp_path / 'first.csv'
+    make_jobs(2).to_csv(first, index=False)
+    second = tmp_path / 'second.csv'
+    make_jobs(3, salary='10000 SAR').to_csv(second, index=False)
+    
+    merged = merge_multiple_sources([str(empty), str(first), str(second)], str(tmp_path / 'merged.csv'))
+    assert isinstance(merged, pd.DataFrame)
+    assert list(merged.columns) == ['job_title', 'company', 'location', 'description', 'salary']
+    assert len(merged) == 3
+    
+    capsys.readouterr()
+    merged_path = merge_csv_files([str(empty), str(first), str(second)], str(tmp_path / 'merged.csv'))
+    assert pd.read_csv(merged_path).equals(merged)
+    assert 'Merged 2 files' in capsys.readouterr().out
+
+
+def test_insert_skips_duplicates_but_rejects_missing_titles(tmp_path):
+    with JobDatabase(str(tmp_path / 'jobs.db')) as db:
+        assert db.insert_jobs(make_jobs(2)) == 2
+        assert db.insert_jobs(make_jobs(3)) == 1
+        
+        missing_title = make_jobs(1).astype(object)
+        missing_title.loc[0, 'job_title'] = None
+        with pytest.raises(sqlite3.IntegrityError):
+            db.insert_jobs(missing_title)
+        assert count_rows(db) == 3
+
+
+def test_duplicate_cleanup_is_logged(tmp_path, capsys):
+    db_path = str(tmp_path / 'jobs.db')
+    with JobDatabase(db_path) as db:
+        db.insert_jobs(make_jobs(2))
+        # Simulate a database from before uniq_job
+        db._conn.execute('DROP INDEX uniq_job')
+        db._conn.execute("INSERT INTO job_postings(job_title, company, location) VALUES ('Engineer 0', 'Acme', 'Riyadh')")
+        db._conn.commit()
+    
+    capsys.readouterr()
+    with JobDatabase(db_path) as db:
+        assert count_rows(db) == 2
+    assert 'Removed 1 duplicate jobs' in capsys.readouterr().out
+
+
+def test_search_handles_punctuated_skill_names(tmp_path):
+    titles = ['C++ Developer', 'C# Engineer', '.NET Developer', 'Cloud Architect', 'Data Engineer']
+    with JobDatabase(str(tmp_path / 'jobs.db')) as db:
+        db.insert_jobs(make_jobs(len(titles), job_title=titles))
+        
+        def found(query, **kwargs):
+            return db.get_jobs_by_title(query, **kwargs)['job_title'].tolist()
+        
+        assert found('C++') == ['C++ Developer']
+        assert found('c#') == ['C# Engineer']
+        assert found('.NET') == ['.NET Developer']
+        assert found('Engine') == ['C# Engineer', 'Data Engineer']
+        assert found('Engine', prefix=False) == []
+        assert found('cloud architect', prefix=False) == ['Cloud Architect']
+
+
+def make_legacy_db(db_path, jobs):
+    """Database written by DataFrame.to_sql, without id or skills_mask columns"""
+    conn = sqlite3.connect(db_path)
+    jobs.to_sql('job_postings', conn, if_exists='append', index=False)
+    conn.close()
+
+
+def table_columns(db_path):
+    """Column names of job_postings"""
+    conn = sqlite3.connect(db_path)
+    columns = [row[1] for row in conn.execute('PRAGMA table_info(job_postings)')]
+    conn.close()
+    return columns
+
+
+def test_legacy_database_without_id_is_rebuilt(tmp_path):
+    db_path = str(tmp_path / 'jobs.db')
+    make_legacy_db(db_path, pd.concat([make_jobs(3), make_jobs(1)], ignore_index=True))
+    
+    with JobDatabase(db_path) as db:
+        # Rebuilt with the proper schema; the duplicate row goes with uniq_job
+        assert count_rows(db) == 3
+        assert table_columns(db_path)[0] == 'id'
+        assert len(db.get_jobs_by_title('Engineer 2')) == 1
+        assert len(db.get_jobs_with_skill('Python')) == 3
+        assert db.insert_jobs(make_jobs(4)) == 1
+
+
+def test_failed_migration_leaves_database_unchanged(tmp_path, monkeypatch):
+    db_path = str(tmp_path / 'jobs.db')
+    make_legacy_db(db_path, make_jobs(2))
+    legacy_columns = table_columns(db_path)
+    
+    def failing_indexes(self, cursor):
+        raise sqlite3.OperationalError('disk I/O error')
+    
+    monkeypatch.setattr(JobDatabase, 'create_indexes', failing_indexes)
+    with pytest.raises(sqlite3.OperationalError):
+        JobDatabase(db_path)
+    
+    assert table_columns(db_path) == legacy_columns
+    conn = sqlite3.connect(db_path)
+    assert conn.execute('SELECT COUNT(*) FROM job_postings').fetchone()[0] == 2
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'job_postings_new'").fetchone()[0] == 0
+    conn.close()
+
+
+def test_fts_index_follows_inserts_updates_and_deletes(tmp_path):
+    with JobDatabase(str(tmp_path / 'jobs.db')) as db:
+        db.insert_jobs(make_jobs(3, location=['Riyadh', 'Jeddah', 'New Riyadh City']))
+        
+        def found(location, **kwargs):
+            return db.get_jobs_by_location(location, **kwargs)['job_title'].tolist()
+        
+        assert found('riy') == ['Engineer 0', 'Engineer 2']
+        assert found('riyadh city') == ['Engineer 2']
+        assert found('riyadh OR jeddah') == []  # OR is a word, not FTS syntax
+        
+        db._conn.execute("UPDATE job_postings SET location = 'Dammam' WHERE job_title = 'Engineer 0'")
+        db._conn.execute("DELETE FROM job_postings WHERE job_title = 'Engineer 2'")
+        db._conn.commit()
+        assert found('riyadh') == []
+        assert found('dammam', prefix=False) == ['Engineer 0']
+
+
+def test_skills_mask_is_backfilled_for_older_databases(tmp_path):
+    db_path = str(tmp_path / 'jobs.db')
+    # job_postings as created before skills_mask existed
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE job_postings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_title TEXT NOT NULL, company TEXT, location TEXT, description TEXT,
+            salary TEXT, experience_level TEXT, posted_date TEXT, source TEXT,
+            scraped_at TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.executemany(
+        'INSERT INTO job_postings(job_title, description) VALUES (?, ?)',
+        [('Data Scientist', 'Python, SQL and AWS'), ('Designer', 'Figma'), ('Analyst', None)]
+    )
+    conn.commit()
+    conn.close()
+    
+    with JobDatabase(db_path) as db:
+        masks = db._conn.execute('SELECT skills_mask FROM job_postings ORDER BY id').fetchall()
+        assert [sorted(skills_from_mask(mask)) for (mask,) in masks] == [['aws', 'python', 'sql'], [], []]
+        assert db.get_jobs_with_skill('SQL')['job_title'].tolist() == ['Data Scientist']
@@ -0,0 +1,128 @@
+"""Tests for the result page parsers and async fetching in src/job_scraper.py"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from src import job_scraper
+
+SCRAPED_AT = '2024-01-15 10:00:00'
+
+INDEED_HTML = """
+<html><body>
+  <div class="job_seen_beacon big">
+    <h2 class="jobTitle">Data Scientist</h2>
+    <span class="companyName">Acme</span>
+    <div class="companyLocation">Riyadh</div>
+    <div class="job-snippet">Python, SQL</div>
+  </div>
+  <div class="job_seen_beacon">
+    <h2 class="jobTitle">Data Analyst</h2>
+    <span class="companyName">Globex</span>
+    <div class="companyLocation">Jeddah</div>
+  </div>
+  <div class="sponsored"><h2 class="jobTitle">Not a card</h2></div>
+</body></html>
+"""
+
+BAYT_HTML = """
+<html><body><ul>
+  <li class="has-pointer-d is-featured">
+    <h2>ML Engineer</h2><b class="t-default">Initech</b><span class="t-mute">Dammam</span>
+  </li>
+  <li class="has-pointer-d"><h2>DevOps Engineer</h2><b class="t-default">Umbrella</b></li>
+  <li class="other"><h2>Not a card</h2></li>
+</ul></body></html>
+"""
+
+
+def parse_with(monkeypatch, use_selectolax, parser, html):
+    """Run a page parser with one HTML backend"""
+    if use_selectolax and job_scraper.LexborHTMLParser is None:
+        pytest.skip("selectolax not installed")
+    monkeypatch.setattr(job_scraper, 'USE_SELECTOLAX', use_selectolax)
+    return parser(html, scraped_at=SCRAPED_AT)
+
+
+@pytest.mark.parametrize('parser, html, titles', [
+    (job_scraper.parse_indeed_page, INDEED_HTML, ['Data Scientist', 'Data Analyst']),
+    (job_scraper.parse_bayt_page, BAYT_HTML, ['ML Engineer', 'DevOps Engineer']),
+])
+def test_backends_agree_on_multi_class_cards(monkeypatch, parser, html, titles):
+    num_bs4, jobs_bs4 = parse_with(monkeypatch, False, parser, html)
+    assert num_bs4 == 2
+    assert [job['job_title'] for job in jobs_bs4] == titles
+    
+    num_lexbor, jobs_lexbor = parse_with(monkeypatch, True, parser, html)
+    assert (num_lexbor, jobs_lexbor) == (num_bs4, jobs_bs4)
+
+
+class FakeResponse:
+    """Just enough of an aiohttp response for JobScraper._fetch"""
+    
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def read(self):
+        return b'<html></html>'
+
+
+class FakeSession:
+    """Returns queued responses and records when each request was sent"""
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_at = []
+    
+    def get(self, url):
+        self.sent_at.append(time.monotonic())
+        return self.responses.pop(0)
+
+
+def test_retry_after_parses_seconds_and_dates():
+    assert job_scraper._retry_after('3') == 3.0
+    assert job_scraper._retry_after('-5') == 0.0
+    assert job_scraper._retry_after(None) is None
+    assert job_scraper._retry_after('soon') is None
+    
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert 55 < job_scraper._retry_after(later) <= 60
+    assert job_scraper._retry_after('Thu, 01 Jan 1970 00:00:00 GMT') == 0.0
+
+
+def test_fetch_waits_out_retry_after_on_the_token_bucket(tmp_path):
+    if job_scraper.aiohttp is None:
+        pytest.skip("aiohttp not installed")
+    scraper = job_scraper.IndeedScraper(output_dir=str(tmp_path))
+    
+    # 100 requests/s would allow the retry after 0.01s; Retry-After asks for 0.2s
+    session = FakeSession([FakeResponse(429, {'Retry-After': '0.2'}), FakeResponse(200)])
+    status, content = asyncio.run(scraper._fetch(session, job_scraper.TokenBucket(100), 'url'))
+    assert (status, content) == (200, b'<html></html>')
+    assert session.sent_at[1] - session.sent_at[0] >= 0.2
+    
+    # A Retry-After beyond BACKOFF_MAX gives up instead of stalling the run
+    session = FakeSession([FakeResponse(503, {'Retry-After': '3600'})])
+    assert asyncio.run(scraper._fetch(session, job_scraper.TokenBucket(100), 'url')) == (503, None)
+
+
+def test_token_bucket_spaces_requests_at_its_rate():
+    async def send(count):
+        bucket = job_scraper.TokenBucket(20)
+        start = time.monotonic()
+        for _ in range(count):
+            await bucket.acquire()
+        return time.monotonic() - start
+    
+    # The first request uses the initial token, the other four wait 1/20s each
+    assert 0.19 <= asyncio.run(send(5)) < 0.5
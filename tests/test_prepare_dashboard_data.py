@@ -0,0 +1,58 @@
+"""Tests for the skills index built by prepare_dashboard_data.py"""
+
+import ast
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+import prepare_dashboard_data
+
+try:
+    import polars
+except ImportError:
+    polars = None
+
+JOBS = pd.DataFrame({
+    'location': ['Riyadh', 'Riyadh', 'Jeddah', 'Riyadh', None],
+    'job_title_clean': ['Data Scientist', 'Data Scientist', 'Data Scientist', 'Data Analyst', 'Data Analyst'],
+    'experience_level': ['Senior', 'Mid', 'Senior', 'Mid', 'Mid'],
+    'skills': [
+        "['python', 'sql', 'aws']",
+        "['python', 'machine learning']",
+        "['sql']",
+        "[]",
+        "['excel', 'power bi', 'sql']"
+    ]
+})
+
+
+def literal_counts(jobs):
+    """Skill frequencies the old way: literal_eval every skills list and count"""
+    return Counter(skill for skills in jobs['skills'] for skill in ast.literal_eval(skills))
+
+
+def index_counts(index, **filters):
+    """Skill frequencies summed from the skills index rows matching filters"""
+    for col, value in filters.items():
+        index = index[index[col] == value]
+    counts = index.groupby('skill', observed=True)['count'].sum()
+    return Counter({skill: count for skill, count in counts.items() if count > 0})
+
+
+@pytest.mark.parametrize('fast_io', [False, True])
+def test_skills_index_matches_literal_eval_counts(tmp_path, monkeypatch, fast_io):
+    if fast_io and polars is None:
+        pytest.skip("polars not installed")
+    monkeypatch.setattr(prepare_dashboard_data, 'PROCESSED_DIR', str(tmp_path))
+    monkeypatch.setattr(prepare_dashboard_data, 'FAST_IO', fast_io)
+    csv_path = tmp_path / 'job_market_clean.csv'
+    JOBS.to_csv(csv_path, index=False)
+    
+    output_path, _ = prepare_dashboard_data.build_skills_index(JOBS, str(csv_path))
+    index = pd.read_parquet(output_path)
+    
+    assert index_counts(index) == literal_counts(JOBS)
+    assert index_counts(index, location='Riyadh') == literal_counts(JOBS[JOBS['location'] == 'Riyadh'])
+    scientists = JOBS[(JOBS['job_title_clean'] == 'Data Scientist') & (JOBS['experience_level'] == 'Senior')]
+    assert index_counts(index, job_title_clean='Data Scientist', experience_level='Senior') == literal_counts(scientists)